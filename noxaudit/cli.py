@@ -2,13 +2,14 @@
 
 from __future__ import annotations
 
+import json
 from datetime import date
 from pathlib import Path
 
 import click
 
 from noxaudit import __version__
-from noxaudit.config import load_config
+from noxaudit.config import load_config, load_config_from_dict
 from noxaudit.cost_ledger import CostLedger
 from noxaudit.decisions import (
     create_baseline_decisions,
@@ -16,10 +17,11 @@ from noxaudit.decisions import (
     load_decisions,
     remove_baseline_decisions,
     save_decision,
+    save_decisions,
 )
 from noxaudit.focus import FOCUS_AREAS
 from noxaudit.models import Decision, DecisionType
-from noxaudit.runner import retrieve_audit, run_audit, submit_audit
+from noxaudit.runner import retrieve_audit, run_audit, run_estimate, submit_audit
 
 
 def _format_tokens(n: int) -> str:
@@ -139,11 +141,31 @@ def _display_cost_summary() -> None:
 @click.group()
 @click.version_option(version=__version__)
 @click.option("--config", "-c", "config_path", default=None, help="Path to noxaudit.yml")
+@click.option(
+    "--config-json", default=None, help="Inline config as a JSON object (instead of --config)"
+)
 @click.pass_context
-def main(ctx, config_path):
+def main(ctx, config_path, config_json):
     """Noxaudit: Nightly AI-powered codebase audits."""
+    if config_path and config_json:
+        raise click.UsageError("Use either --config or --config-json, not both.")
     ctx.ensure_object(dict)
     ctx.obj["config_path"] = config_path
+    ctx.obj["config_json"] = config_json
+
+
+def _load_config(ctx):
+    """Load the config from --config-json when given, else from the --config file."""
+    raw = ctx.obj.get("config_json")
+    if raw is None:
+        return load_config(ctx.obj["config_path"])
+    try:
+        data = json.loads(raw)
+    except ValueError as e:
+        raise click.BadParameter(f"not valid JSON: {e}", param_hint="--config-json")
+    if not isinstance(data, dict):
+        raise click.BadParameter("must be a JSON object", param_hint="--config-json")
+    return load_config_from_dict(data)
 
 
 @main.command()
@@ -162,7 +184,7 @@ def main(ctx, config_path):
 @click.pass_context
 def run(ctx, repo, focus, provider, dry_run, output_format):
     """Run an audit."""
-    config = load_config(ctx.obj["config_path"])
+    config = _load_config(ctx)
     results = run_audit(
         config,
         repo_name=repo,
@@ -187,7 +209,7 @@ def run(ctx, repo, focus, provider, dry_run, output_format):
 @click.pass_context
 def submit(ctx, repo, focus, provider, dry_run):
     """Submit a batch audit (returns immediately, results retrieved later)."""
-    config = load_config(ctx.obj["config_path"])
+    config = _load_config(ctx)
     pending = submit_audit(
         config, repo_name=repo, focus_name=focus, provider_name=provider, dry_run=dry_run
     )
@@ -213,7 +235,7 @@ def submit(ctx, repo, focus, provider, dry_run):
 @click.pass_context
 def retrieve(ctx, pending_file, output_format):
     """Retrieve results from a previously submitted batch."""
-    config = load_config(ctx.obj["config_path"])
+    config = _load_config(ctx)
     results = retrieve_audit(config, pending_path=pending_file, output_format=output_format)
 
     if not results:
@@ -241,7 +263,7 @@ def retrieve(ctx, pending_file, output_format):
 @click.pass_context
 def decide(ctx, finding_id, action, reason, by):
     """Record a decision about a finding."""
-    config = load_config(ctx.obj["config_path"])
+    config = _load_config(ctx)
 
     type_map = {
         "accept": DecisionType.ACCEPTED,
@@ -264,7 +286,7 @@ def decide(ctx, finding_id, action, reason, by):
 @click.pass_context
 def status(ctx):
     """Show current configuration and status."""
-    config = load_config(ctx.obj["config_path"])
+    config = _load_config(ctx)
 
     click.echo(f"Noxaudit v{__version__}")
     click.echo("")
@@ -301,7 +323,7 @@ def status(ctx):
 @click.pass_context
 def report(ctx, repo, focus):
     """Show the latest report."""
-    config = load_config(ctx.obj["config_path"])
+    config = _load_config(ctx)
     reports_dir = Path(config.reports_dir)
 
     if not reports_dir.exists():
@@ -331,50 +353,15 @@ def report(ctx, repo, focus):
 @click.pass_context
 def estimate(ctx, repo, focus, provider):
     """Estimate audit cost before running (no API keys needed)."""
-    from noxaudit.focus import FOCUS_AREAS
-    from noxaudit.focus.base import gather_files_combined
-    from noxaudit.pricing import build_estimate_report, resolve_model_key
-    from noxaudit.runner import _resolve_focus_names
-
-    config = load_config(ctx.obj["config_path"])
+    config = _load_config(ctx)
 
     try:
-        focus_names = _resolve_focus_names(focus, config)
+        output = run_estimate(config, repo_name=repo, focus_name=focus, provider_name=provider)
     except ValueError as e:
         raise click.ClickException(str(e))
 
-    if not focus_names:
-        return
-
-    repos = config.repos
-    if repo:
-        repos = [r for r in repos if r.name == repo]
-        if not repos:
-            raise click.ClickException(f"Unknown repo: {repo}")
-
-    if not repos:
-        click.echo("No repos configured. Add repos to noxaudit.yml.")
-        return
-
-    for repo_cfg in repos:
-        focus_instances = [FOCUS_AREAS[name]() for name in focus_names]
-        files = gather_files_combined(focus_instances, repo_cfg.path, repo_cfg.exclude_patterns)
-
-        if not files:
-            click.echo(f"\n  {repo_cfg.name}: No files found matching focus areas.")
-            continue
-
-        pname = provider or config.get_provider_for_repo(repo_cfg.name)
-        model_key = resolve_model_key(pname, config.model)
-
-        report = build_estimate_report(
-            repo_name=repo_cfg.name,
-            focus_names=focus_names,
-            files=files,
-            provider_name=pname,
-            model_key=model_key,
-        )
-        click.echo(report)
+    if output:
+        click.echo(output)
 
 
 @main.command("mcp-server")
@@ -401,7 +388,7 @@ def mcp_server():
 @click.pass_context
 def baseline(ctx, repo, focus, severity, undo, list_baselines):
     """Baseline existing findings to suppress them in future audits."""
-    config = load_config(ctx.obj["config_path"])
+    config = _load_config(ctx)
 
     if list_baselines:
         baselines = list_baseline_decisions(config.decisions.path)
@@ -457,8 +444,7 @@ def baseline(ctx, repo, focus, severity, undo, list_baselines):
                 break
 
     decisions = create_baseline_decisions(findings, repo_path, repo_name=repo)
-    for decision in decisions:
-        save_decision(config.decisions.path, decision)
+    save_decisions(config.decisions.path, decisions)
 
     click.echo(f"Baselined {len(decisions)} findings from latest audit.")
     click.echo("These will not appear in future reports unless the affected files change.")
@@ -2,15 +2,24 @@
 
 from __future__ import annotations
 
+import copy
+import functools
 import os
+import re
+import sys
 import warnings
 from dataclasses import dataclass, field
 from pathlib import Path
 
 import yaml
 
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:  # PyYAML built without LibYAML
+    from yaml import SafeLoader as _YamlLoader
 
-@dataclass
+
+@dataclass(frozen=True, slots=True)
 class RepoConfig:
     name: str
     path: str
@@ -18,26 +27,26 @@ class RepoConfig:
     exclude_patterns: list[str] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class BudgetConfig:
     max_per_run_usd: float = 2.0
     alert_threshold_usd: float = 1.5
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class NotificationConfig:
     channel: str = "telegram"
     target: str = ""
     webhook: str = ""
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class DecisionConfig:
     expiry_days: int = 90
     path: str = ".noxaudit/decisions.jsonl"
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class IssuesConfig:
     enabled: bool = False
     severity_threshold: str = "medium"  # "low", "medium", or "high"
@@ -46,7 +55,7 @@ class IssuesConfig:
     repository_url: str = "https://github.com/atriumn/noxaudit"
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class PrepassConfig:
     """Pre-pass configuration for file filtering before main audit."""
 
@@ -55,7 +64,7 @@ class PrepassConfig:
     auto_disable: bool = False
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ProviderConfig:
     """Per-provider configuration (e.g., model overrides)."""
 
@@ -73,29 +82,52 @@ ALL_FOCUS_NAMES = [
 ]
 
 
-def normalize_focus(raw: str | list[str] | bool) -> list[str]:
+def normalize_focus(raw: str | list[str] | tuple[str, ...] | bool | None) -> list[str]:
     """Normalize a focus value to a list of focus area names.
 
     "off"/False → [], "all" → all names, "security" → ["security"],
-    "security,performance" → ["security", "performance"], list passthrough.
+    "security,performance" → ["security", "performance"], list/tuple passthrough.
     """
+    # Most common inputs first: YAML off/on/absent, then a single known name
+    if raw is None or raw is False:
+        return []
+    if raw is True:
+        return list(ALL_FOCUS_NAMES)
+    if type(raw) is str:
+        expanded = _FOCUS_TABLE.get(raw)
+        if expanded is not None:
+            return list(expanded)
+    elif isinstance(raw, (list, tuple)):
+        return [str(item) for item in raw]
+    # Everything else is memoized; copy so callers never mutate the cached value
+    return list(_normalize_focus_scalar(raw))
+
+
+_COMMA_RE = re.compile(r"\s*,\s*")
+
+# Precomputed expansions for every single-token focus value
+_FOCUS_TABLE: dict[str, tuple[str, ...]] = {
+    "off": (),
+    "all": tuple(ALL_FOCUS_NAMES),
+    **{name: (name,) for name in ALL_FOCUS_NAMES},
+}
+
+
+@functools.lru_cache(maxsize=128, typed=True)
+def _normalize_focus_scalar(raw: str | bool | None) -> tuple[str, ...]:
+    """Memoized core of normalize_focus for hashable (non-list) values."""
     # YAML parses bare `off` as False, `on` as True
     if isinstance(raw, bool) or raw is None:
-        return [] if not raw else list(ALL_FOCUS_NAMES)
-    if isinstance(raw, list):
-        return [str(item) for item in raw]
+        return _FOCUS_TABLE["all"] if raw else ()
     raw = str(raw)
-    if raw == "off":
-        return []
-    if raw == "all":
-        return list(ALL_FOCUS_NAMES)
-    # Support comma-separated string from CLI
+    # Support comma-separated string from CLI; intern the pieces so they share
+    # storage with the focus-name literals used throughout the codebase
     if "," in raw:
-        return [s.strip() for s in raw.split(",") if s.strip()]
-    return [raw]
+        return tuple(sys.intern(s) for s in _COMMA_RE.split(raw.strip()) if s)
+    return _FOCUS_TABLE.get(raw, (raw,))
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class NoxauditConfig:
     repos: list[RepoConfig] = field(default_factory=list)
     budget: BudgetConfig = field(default_factory=BudgetConfig)
@@ -129,28 +161,53 @@ def load_config(config_path: str | Path | None = None) -> NoxauditConfig:
     else:
         config_path = Path(config_path)
 
-    if not config_path.exists():
+    # One stat both detects a missing file and keys the parse cache
+    try:
+        st = config_path.stat()
+    except FileNotFoundError:
         return NoxauditConfig()
+    config, top_level_keys = _load_cached(str(config_path.resolve()), st.st_mtime_ns, st.st_size)
+
+    _warn_deprecated_keys(top_level_keys)
+
+    # Callers get their own copy so the cached instance is never mutated
+    return copy.deepcopy(config)
+
 
-    with open(config_path) as f:
-        raw = yaml.safe_load(f) or {}
+def load_config_from_dict(data: dict) -> NoxauditConfig:
+    """Build a config from an already-parsed mapping, as if read from noxaudit.yml."""
+    _warn_deprecated_keys(data)
+    return _build_config(data)
 
-    # Emit deprecation warnings for removed config keys
-    if "schedule" in raw:
+
+def _warn_deprecated_keys(keys) -> None:
+    """Emit deprecation warnings for removed top-level config keys."""
+    if "schedule" in keys:
         warnings.warn(
             "The 'schedule' config key is deprecated and ignored. "
             "Use --focus or set up cron-based scheduling instead.",
             DeprecationWarning,
-            stacklevel=2,
+            stacklevel=3,
         )
-    if "frames" in raw:
+    if "frames" in keys:
         warnings.warn(
             "The 'frames' config key is deprecated and ignored. "
             "Use --focus or set up cron-based scheduling instead.",
             DeprecationWarning,
-            stacklevel=2,
+            stacklevel=3,
         )
 
+
+@functools.lru_cache(maxsize=32)
+def _load_cached(path: str, mtime_ns: int, size: int) -> tuple[NoxauditConfig, frozenset[str]]:
+    """Parse and build a config; keyed on the file's stat so edits invalidate it."""
+    with open(path) as f:
+        raw = yaml.load(f, Loader=_YamlLoader) or {}
+    return _build_config(raw), frozenset(raw)
+
+
+def _build_config(raw: dict) -> NoxauditConfig:
+    """Build a NoxauditConfig from the parsed YAML mapping."""
     repos = []
     for r in raw.get("repos", []):
         repos.append(
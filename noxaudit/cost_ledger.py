@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import json
+from collections.abc import Iterable
 from datetime import datetime, timedelta
 from pathlib import Path
 
@@ -32,6 +33,43 @@ class CostLedger:
 
         Creates the ledger file if it doesn't exist.
         """
+        entry = cls._build_entry(
+            repo=repo,
+            focus=focus,
+            provider=provider,
+            model=model,
+            input_tokens=input_tokens,
+            output_tokens=output_tokens,
+            cache_read_tokens=cache_read_tokens,
+            cache_write_tokens=cache_write_tokens,
+            file_count=file_count,
+            timestamp=timestamp,
+        )
+        cls._write_entries([entry])
+
+    @classmethod
+    def append_entries(cls, entries: Iterable[dict]) -> None:
+        """Append several entries to the cost ledger with a single file open.
+
+        Each item holds the keyword arguments accepted by ``append_entry``.
+        """
+        cls._write_entries([cls._build_entry(**kwargs) for kwargs in entries])
+
+    @classmethod
+    def _build_entry(
+        cls,
+        repo: str,
+        focus: str,
+        provider: str,
+        model: str,
+        input_tokens: int,
+        output_tokens: int,
+        cache_read_tokens: int,
+        cache_write_tokens: int,
+        file_count: int,
+        timestamp: str | None = None,
+    ) -> dict:
+        """Build a ledger entry, pricing it from the model's pricing data."""
         if timestamp is None:
             timestamp = datetime.now().isoformat()
 
@@ -52,7 +90,7 @@ class CostLedger:
                 cache_write_tokens=cache_write_tokens,
             )
 
-        entry = {
+        return {
             "timestamp": timestamp,
             "repo": repo,
             "focus": focus,
@@ -66,9 +104,14 @@ class CostLedger:
             "cost_estimate_usd": round(cost_estimate, 4),
         }
 
+    @classmethod
+    def _write_entries(cls, entries: list[dict]) -> None:
+        """Append serialized entries to the ledger file, creating it if needed."""
+        if not entries:
+            return
         cls.LEDGER_PATH.parent.mkdir(parents=True, exist_ok=True)
         with open(cls.LEDGER_PATH, "a") as f:
-            f.write(json.dumps(entry) + "\n")
+            f.writelines(json.dumps(entry, separators=(",", ":")) + "\n" for entry in entries)
 
     @classmethod
     def read_entries(cls) -> list[dict]:
@@ -81,16 +124,14 @@ class CostLedger:
             return []
 
         entries = []
-        with open(cls.LEDGER_PATH) as f:
-            for line in f:
-                line = line.strip()
-                if not line:
-                    continue
-                try:
-                    entries.append(json.loads(line))
-                except json.JSONDecodeError:
-                    # Skip malformed lines
-                    continue
+        for line in cls.LEDGER_PATH.read_bytes().splitlines():
+            if not line.strip():
+                continue
+            try:
+                entries.append(json.loads(line))
+            except ValueError:
+                # Skip malformed lines (bad JSON or bad UTF-8)
+                continue
 
         return entries
 
@@ -113,7 +154,8 @@ class CostLedger:
                 if entry_time >= cutoff:
                     result.append(entry)
             except (ValueError, TypeError):
-                # Skip entries with invalid timestamps
+                # Skip entries with invalid timestamps (including tz-aware ones,
+                # which can't be compared with the naive local cutoff)
                 continue
 
         return result
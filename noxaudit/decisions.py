@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import hashlib
 import json
+from collections.abc import Iterable
 from datetime import date, timedelta
 from pathlib import Path
 
@@ -17,7 +18,8 @@ def load_decisions(decisions_path: str | Path) -> list[Decision]:
         return []
 
     decisions = []
-    for line in path.read_text().strip().splitlines():
+    # json.loads takes bytes directly, so skip the separate text decode pass
+    for line in path.read_bytes().splitlines():
         if not line.strip():
             continue
         raw = json.loads(line)
@@ -40,10 +42,18 @@ def load_decisions(decisions_path: str | Path) -> list[Decision]:
 
 def save_decision(decisions_path: str | Path, decision: Decision) -> None:
     """Append a decision to the JSONL file."""
+    save_decisions(decisions_path, [decision])
+
+
+def save_decisions(decisions_path: str | Path, decisions: Iterable[Decision]) -> None:
+    """Append several decisions to the JSONL file with a single open and write."""
+    lines = [json.dumps(d.to_dict()) + "\n" for d in decisions]
+    if not lines:
+        return
     path = Path(decisions_path)
     path.parent.mkdir(parents=True, exist_ok=True)
     with open(path, "a") as f:
-        f.write(json.dumps(decision.to_dict()) + "\n")
+        f.write("".join(lines))
 
 
 def filter_findings(
@@ -51,11 +61,13 @@ def filter_findings(
     decisions: list[Decision],
     repo_path: str | Path,
     expiry_days: int = 90,
+    today: date | None = None,
 ) -> tuple[list[Finding], int]:
     """Filter findings against decision history.
 
     Returns (new_findings, resolved_count) where resolved_count is
-    how many previous findings are still resolved.
+    how many previous findings are still resolved. ``today`` defaults
+    to the current date and is used to expire old decisions.
     """
     # Build lookup: finding_id -> most recent decision
     decision_map: dict[str, Decision] = {}
@@ -63,7 +75,10 @@ def filter_findings(
         if d.finding_id not in decision_map or d.date > decision_map[d.finding_id].date:
             decision_map[d.finding_id] = d
 
-    today = date.today()
+    if today is None:
+        today = date.today()
+    cutoff = today - timedelta(days=expiry_days)
+
     new_findings = []
     resolved_count = 0
 
@@ -73,13 +88,11 @@ def filter_findings(
             new_findings.append(finding)
             continue
 
-        # Check expiry
-        if decision.date:
-            decision_date = date.fromisoformat(decision.date)
-            if today - decision_date > timedelta(days=expiry_days):
-                # Decision expired, resurface
-                new_findings.append(finding)
-                continue
+        # Check expiry; only dates of decisions that match a finding are parsed
+        if decision.date and date.fromisoformat(decision.date) < cutoff:
+            # Decision expired, resurface
+            new_findings.append(finding)
+            continue
 
         # Check if file changed since decision
         if decision.file_hash and finding.file:
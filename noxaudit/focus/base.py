@@ -119,8 +119,13 @@ def gather_files_combined(
     focus_areas: list[BaseFocus],
     repo_path: str | Path,
     exclude_patterns: list[str] | None = None,
+    with_content: bool = True,
 ) -> list[FileContent]:
-    """Gather files from repo matching the union of all focus areas' patterns, deduped by path."""
+    """Gather files from repo matching the union of all focus areas' patterns, deduped by path.
+
+    With ``with_content=False`` files are not opened: each FileContent has empty
+    content and its size taken from the on-disk byte count (enough for estimates).
+    """
     repo = Path(repo_path)
     exclude = set(exclude_patterns or [])
     exclude.update(["node_modules", ".git", "__pycache__", ".venv", "venv", "dist", "build"])
@@ -137,13 +142,18 @@ def gather_files_combined(
         for path in sorted(repo.glob(pattern)):
             if not path.is_file():
                 continue
-            if path.stat().st_size > MAX_FILE_SIZE:
+            size = path.stat().st_size
+            if size > MAX_FILE_SIZE:
                 continue
             rel = str(path.relative_to(repo))
             if rel in seen_paths:
                 continue
             if any(ex in rel for ex in exclude):
                 continue
+            if not with_content:
+                files.append(FileContent(path=rel, content="", size=size))
+                seen_paths.add(rel)
+                continue
             try:
                 content = path.read_text(errors="replace")
                 files.append(FileContent(path=rel, content=content))
@@ -19,13 +19,20 @@ class DecisionType(str, Enum):
     INTENTIONAL = "intentional"  # Code is correct as-is, don't flag again
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class FileContent:
     path: str  # Relative to repo root
     content: str
+    # Character count, or the on-disk byte size when content is elided (with_content=False).
+    # Both feed the ~4-chars-per-token estimates, where bytes and chars are close enough.
+    size: int | None = None
 
+    def __post_init__(self):
+        if self.size is None:
+            object.__setattr__(self, "size", len(self.content))
 
-@dataclass
+
+@dataclass(frozen=True, slots=True)
 class Finding:
     id: str  # Stable hash for decision matching
     severity: Severity
@@ -2,12 +2,13 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+import functools
+from dataclasses import dataclass, field
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ModelPricing:
-    """Per-model pricing data."""
+    """Per-model pricing data. Frozen so it can key the estimate_cost cache."""
 
     input_per_million: float  # $/M tokens, standard tier
     output_per_million: float  # $/M tokens, standard tier
@@ -136,11 +137,19 @@ _MODEL_PROVIDER: dict[str, str] = {
     "gpt-5.4": "openai",
 }
 
+# Flattened (key, provider, pricing, use_batch) rows for scanning every model at once
+_PRICING_ROWS: tuple[tuple[str, str, ModelPricing, bool], ...] = tuple(
+    (key, _MODEL_PROVIDER[key], pricing, pricing.batch_discount > 0)
+    for key, pricing in MODEL_PRICING.items()
+)
+
 
+@functools.lru_cache(maxsize=64)
 def resolve_model_key(provider: str, model: str) -> str:
     """Map a provider + model name to a MODEL_PRICING key.
 
     Tries direct lookup first, then falls back to provider-based heuristics.
+    Memoized: ledger writes and status repricing resolve the same few pairs repeatedly.
     """
     if model in MODEL_PRICING:
         return model
@@ -172,6 +181,7 @@ def resolve_model_key(provider: str, model: str) -> str:
     return "gemini-2.5-flash"
 
 
+@functools.lru_cache(maxsize=1024)
 def estimate_cost(
     input_tokens: int,
     output_tokens: int,
@@ -185,7 +195,8 @@ def estimate_cost(
     Handles tiered pricing split at threshold. When input exceeds the tier
     threshold, output tokens are also billed at the high tier rate (matching
     Anthropic actual pricing). Cache tokens are billed at flat rates (not
-    tiered). Batch discount applied last to the combined total.
+    tiered). Batch discount applied last to the combined total. Memoized,
+    since estimates and status repricing repeat the same few argument sets.
     """
     if (
         input_tokens == 0
@@ -195,15 +206,16 @@ def estimate_cost(
     ):
         return 0.0
 
-    if pricing.tier_threshold and input_tokens > pricing.tier_threshold:
-        standard_input = pricing.tier_threshold
-        high_input = input_tokens - pricing.tier_threshold
-        input_cost = (standard_input / 1_000_000) * pricing.input_per_million
-        input_cost += (high_input / 1_000_000) * (pricing.input_per_million_high or 0.0)
-        output_cost = (output_tokens / 1_000_000) * (pricing.output_per_million_high or 0.0)
-    else:
-        input_cost = (input_tokens / 1_000_000) * pricing.input_per_million
-        output_cost = (output_tokens / 1_000_000) * pricing.output_per_million
+    # Split input at the tier threshold; the high part is zero at or below it
+    standard_input = min(input_tokens, pricing.tier_threshold or input_tokens)
+    high_input = input_tokens - standard_input
+    input_cost = (standard_input / 1_000_000) * pricing.input_per_million
+    input_cost += (high_input / 1_000_000) * (pricing.input_per_million_high or 0.0)
+    # Crossing the threshold moves output to the high tier as well
+    output_rate = (
+        (pricing.output_per_million_high or 0.0) if high_input else pricing.output_per_million
+    )
+    output_cost = (output_tokens / 1_000_000) * output_rate
 
     # Cache tokens are billed at flat rates, not subject to tiered pricing
     cache_read_cost = (cache_read_tokens / 1_000_000) * pricing.cache_read_per_million
@@ -235,15 +247,15 @@ def estimate_prepass_reduction(files: list, total_tokens: int) -> dict:
         return {"reduced_tokens": 0, "triage_cost": 0.0, "high": 0, "medium": 0, "low_skip": 0}
 
     n = len(files)
-    sorted_files = sorted(files, key=lambda f: len(f.content))
+    # Sort bare sizes rather than the file objects; only the sizes matter here
+    sizes = sorted(f.size for f in files)
 
     high_count = max(1, round(n * 0.15))
     medium_count = max(1, round(n * 0.30))
     low_skip_count = n - high_count - medium_count
 
     # Kept files: high + medium priority (smallest files in ascending sort)
-    kept_files = sorted_files[: high_count + medium_count]
-    reduced_tokens = sum(len(f.content) // 4 for f in kept_files)
+    reduced_tokens = sum(size // 4 for size in sizes[: high_count + medium_count])
 
     # Triage cost: run gemini-2.5-flash on all files (~60 output tokens per file)
     flash_pricing = MODEL_PRICING["gemini-2.5-flash"]
@@ -268,70 +280,89 @@ def _fmt_tokens(n: int) -> str:
     return str(n)
 
 
-def build_estimate_report(
+# Daily runs assumed for the monthly projection
+MONTHLY_RUNS = 30
+
+
+@dataclass
+class EstimateAlternative:
+    """A cheaper model than the configured one, priced for the same workload."""
+
+    model_key: str
+    provider: str
+    cost: float
+    savings_pct: int
+
+
+@dataclass
+class EstimateReport:
+    """Structured cost estimate for one repo; rendered by format_estimate_report."""
+
+    repo_name: str
+    focus_names: list[str]
+    file_count: int
+    input_tokens: int
+    output_tokens: int
+    provider_name: str
+    model_key: str
+    cost: float
+    use_batch: bool
+    tiered: bool
+    alternatives: list[EstimateAlternative] = field(default_factory=list)  # cheapest first
+    prepass: dict | None = None  # estimate_prepass_reduction() result, when it saves money
+    prepass_cost: float = 0.0  # Reduced-token cost plus triage cost
+    prepass_savings_pct: int = 0
+
+    @property
+    def monthly_cost(self) -> float:
+        return self.cost * MONTHLY_RUNS
+
+
+def compute_estimate_report(
     repo_name: str,
     focus_names: list[str],
     files: list,
     provider_name: str,
     model_key: str,
-) -> str:
-    """Assemble a human-readable cost estimate report."""
-    lines: list[str] = [""]
-
-    # Header
-    focus_display = " + ".join(focus_names)
-    header = f"  {repo_name} — {focus_display}"
-    lines.append(header)
-    lines.append("")
-
+) -> EstimateReport:
+    """Price a repo's files on the given model and find cheaper alternatives."""
     # Token count (rough: 1 token per 4 chars)
-    total_tokens = sum(len(f.content) // 4 for f in files)
-    lines.append(f"  Files:     {len(files)} files, {_fmt_tokens(total_tokens)} tokens")
+    total_tokens = sum(f.size // 4 for f in files)
 
     pricing = MODEL_PRICING[model_key]
     use_batch = pricing.batch_discount > 0
-    lines.append(f"  Provider:  {provider_name} ({model_key})")
-    lines.append("")
-
     output_tokens = estimate_output_tokens(total_tokens, len(focus_names))
     cost = estimate_cost(total_tokens, output_tokens, pricing, use_batch=use_batch)
     tiered = bool(pricing.tier_threshold and total_tokens > pricing.tier_threshold)
 
-    if tiered:
-        lines.append(f"  ! Cost estimate: ~${cost:.2f}")
-        lines.append(
-            f"    Your token count ({_fmt_tokens(total_tokens)}) exceeds "
-            f"Anthropic's 200K standard tier."
-        )
-        lines.append(
-            f"    Tiered pricing applies: ${pricing.input_per_million_high:.2f}/M input "
-            f"(2x standard rate)."
-        )
-        if use_batch:
-            lines.append("    Batch API 50% discount applied.")
-    else:
-        lines.append(f"  Cost estimate: ~${cost:.2f}")
-        if use_batch:
-            lines.append("    Batch API 50% discount applied.")
-    lines.append("")
+    report = EstimateReport(
+        repo_name=repo_name,
+        focus_names=focus_names,
+        file_count=len(files),
+        input_tokens=total_tokens,
+        output_tokens=output_tokens,
+        provider_name=provider_name,
+        model_key=model_key,
+        cost=cost,
+        use_batch=use_batch,
+        tiered=tiered,
+    )
 
     # Alternatives (cheaper models)
-    alternatives: list[tuple[str, str, float, int]] = []
-    for alt_key, alt_pricing in MODEL_PRICING.items():
+    # Every model sees the same input, so the output estimate is shared
+    for alt_key, alt_provider, alt_pricing, alt_use_batch in _PRICING_ROWS:
         if alt_key == model_key:
             continue
-        alt_provider = _MODEL_PROVIDER[alt_key]
-        alt_output = estimate_output_tokens(total_tokens, len(focus_names))
-        alt_use_batch = alt_pricing.batch_discount > 0
-        alt_cost = estimate_cost(total_tokens, alt_output, alt_pricing, use_batch=alt_use_batch)
+        alt_cost = estimate_cost(total_tokens, output_tokens, alt_pricing, use_batch=alt_use_batch)
         if cost > 0 and alt_cost < cost:
             savings_pct = int((1.0 - alt_cost / cost) * 100)
-            alternatives.append((alt_key, alt_provider, alt_cost, savings_pct))
+            report.alternatives.append(
+                EstimateAlternative(alt_key, alt_provider, alt_cost, savings_pct)
+            )
 
-    alternatives.sort(key=lambda x: x[2])
+    report.alternatives.sort(key=lambda alt: alt.cost)
 
     # Pre-pass alternative (only when Anthropic exceeds tier threshold)
-    prepass_info: tuple | None = None
     if tiered and provider_name == "anthropic":
         prepass = estimate_prepass_reduction(files, total_tokens)
         reduced_tokens = prepass["reduced_tokens"]
@@ -339,64 +370,101 @@ def build_estimate_report(
         no_tier_cost = estimate_cost(reduced_tokens, reduced_output, pricing, use_batch=use_batch)
         total_prepass_cost = no_tier_cost + prepass["triage_cost"]
         if cost > 0 and total_prepass_cost < cost:
-            pp_savings_pct = int((1.0 - total_prepass_cost / cost) * 100)
-            prepass_info = (prepass, reduced_tokens, total_prepass_cost, pp_savings_pct)
+            report.prepass = prepass
+            report.prepass_cost = total_prepass_cost
+            report.prepass_savings_pct = int((1.0 - total_prepass_cost / cost) * 100)
 
-    if alternatives or prepass_info:
+    return report
+
+
+def format_estimate_report(report: EstimateReport) -> str:
+    """Render an EstimateReport as the human-readable text shown by `noxaudit estimate`."""
+    pricing = MODEL_PRICING[report.model_key]
+    lines: list[str] = [""]
+
+    # Header
+    focus_display = " + ".join(report.focus_names)
+    header = f"  {report.repo_name} — {focus_display}"
+    lines.append(header)
+    lines.append("")
+
+    lines.append(
+        f"  Files:     {report.file_count} files, {_fmt_tokens(report.input_tokens)} tokens"
+    )
+    lines.append(f"  Provider:  {report.provider_name} ({report.model_key})")
+    lines.append("")
+
+    if report.tiered:
+        lines.append(f"  ! Cost estimate: ~${report.cost:.2f}")
+        lines.append(
+            f"    Your token count ({_fmt_tokens(report.input_tokens)}) exceeds "
+            f"Anthropic's 200K standard tier."
+        )
+        lines.append(
+            f"    Tiered pricing applies: ${pricing.input_per_million_high:.2f}/M input "
+            f"(2x standard rate)."
+        )
+        if report.use_batch:
+            lines.append("    Batch API 50% discount applied.")
+    else:
+        lines.append(f"  Cost estimate: ~${report.cost:.2f}")
+        if report.use_batch:
+            lines.append("    Batch API 50% discount applied.")
+    lines.append("")
+
+    if report.alternatives or report.prepass:
         lines.append("  Alternatives:")
-        for alt_key, alt_provider, alt_cost, savings_pct in alternatives:
-            desc = f"{alt_provider} ({alt_key})"
+        for alt in report.alternatives:
+            desc = f"{alt.provider} ({alt.model_key})"
             note = ""
-            if alt_provider == "gemini" and savings_pct >= 90:
+            if alt.provider == "gemini" and alt.savings_pct >= 90:
                 note = " — recommended for daily audits"
-            elif "sonnet" in alt_key:
+            elif "sonnet" in alt.model_key:
                 note = " — similar quality, lower cost"
-            lines.append(f"    {desc:<38} ~${alt_cost:.2f}   {savings_pct}% cheaper{note}")
-        if prepass_info:
-            _, _, total_prepass_cost, pp_savings_pct = prepass_info
-            desc = f"{provider_name} + pre-pass"
-            note = f" — Flash triage keeps {model_key} under 200K tier"
+            lines.append(f"    {desc:<38} ~${alt.cost:.2f}   {alt.savings_pct}% cheaper{note}")
+        if report.prepass:
+            desc = f"{report.provider_name} + pre-pass"
+            note = f" — Flash triage keeps {report.model_key} under 200K tier"
             lines.append(
-                f"    {desc:<38} ~${total_prepass_cost:.2f}   {pp_savings_pct}% cheaper{note}"
+                f"    {desc:<38} ~${report.prepass_cost:.2f}   "
+                f"{report.prepass_savings_pct}% cheaper{note}"
             )
         lines.append("")
 
     # Pre-pass detail section
-    if prepass_info:
-        prepass, reduced_tokens, total_prepass_cost, _ = prepass_info
+    if report.prepass:
+        prepass = report.prepass
         lines.append("  Pre-pass estimate:")
         lines.append(f"    Gemini Flash triage: ~${prepass['triage_cost']:.2f}")
         lines.append(
-            f"    Expected reduction: {_fmt_tokens(total_tokens)} → "
-            f"~{_fmt_tokens(reduced_tokens)} tokens "
+            f"    Expected reduction: {_fmt_tokens(report.input_tokens)} → "
+            f"~{_fmt_tokens(prepass['reduced_tokens'])} tokens "
             f"(high: {prepass['high']} files, medium: {prepass['medium']}, "
             f"low/skip: {prepass['low_skip']})"
         )
         lines.append(
-            f"    With pre-pass, {model_key} stays in standard pricing tier "
+            f"    With pre-pass, {report.model_key} stays in standard pricing tier "
             f"(${pricing.input_per_million:.2f}/M vs "
             f"${pricing.input_per_million_high:.2f}/M)"
         )
         lines.append("")
 
     # Monthly projection (assuming daily runs)
-    monthly_runs = 30
-    monthly_cost = cost * monthly_runs
-    lines.append(f"  Monthly estimate: ~${monthly_cost:.2f} (assuming daily runs)")
+    lines.append(f"  Monthly estimate: ~${report.monthly_cost:.2f} (assuming daily runs)")
 
-    if alternatives:
-        cheapest_key, cheapest_provider, cheapest_cost, _ = alternatives[0]
-        monthly_cheapest = cheapest_cost * monthly_runs
-        lines.append(f"  Monthly with {cheapest_key}: ~${monthly_cheapest:.2f}")
+    if report.alternatives:
+        cheapest = report.alternatives[0]
+        monthly_cheapest = cheapest.cost * MONTHLY_RUNS
+        lines.append(f"  Monthly with {cheapest.model_key}: ~${monthly_cheapest:.2f}")
 
     lines.append("")
 
     # Recommendation for expensive Anthropic with cheap gemini alternative
-    if tiered and alternatives:
-        cheapest_key, cheapest_provider, cheapest_cost, _ = alternatives[0]
-        if cheapest_provider == "gemini":
+    if report.tiered and report.alternatives:
+        cheapest = report.alternatives[0]
+        if cheapest.provider == "gemini":
             lines.append(
-                f"  Recommendation: Use gemini for daily audits (~${cheapest_cost:.2f}/run)."
+                f"  Recommendation: Use gemini for daily audits (~${cheapest.cost:.2f}/run)."
             )
             lines.append(
                 "  Reserve anthropic for monthly deep dives where finding depth matters most."
@@ -404,3 +472,16 @@ def build_estimate_report(
             lines.append("")
 
     return "\n".join(lines)
+
+
+def build_estimate_report(
+    repo_name: str,
+    focus_names: list[str],
+    files: list,
+    provider_name: str,
+    model_key: str,
+) -> str:
+    """Assemble a human-readable cost estimate report."""
+    return format_estimate_report(
+        compute_estimate_report(repo_name, focus_names, files, provider_name, model_key)
+    )
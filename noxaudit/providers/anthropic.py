@@ -2,13 +2,12 @@
 
 from __future__ import annotations
 
-import hashlib
 import json
 import os
 
 import anthropic
 
-from noxaudit.models import FileContent, Finding, Severity
+from noxaudit.models import FileContent, Finding
 from noxaudit.providers.base import BaseProvider
 
 FINDING_SCHEMA = {
@@ -37,6 +36,9 @@ FINDING_SCHEMA = {
     "required": ["findings"],
 }
 
+# Rendered once for the user message rather than on every request
+_SCHEMA_JSON = json.dumps(FINDING_SCHEMA, indent=2)
+
 
 class AnthropicProvider(BaseProvider):
     name = "anthropic"
@@ -47,12 +49,6 @@ class AnthropicProvider(BaseProvider):
             raise ValueError("ANTHROPIC_API_KEY environment variable is required")
         self.client = anthropic.Anthropic(api_key=api_key)
         self.model = model
-        self._last_usage = {
-            "input_tokens": 0,
-            "output_tokens": 0,
-            "cache_read_tokens": 0,
-            "cache_write_tokens": 0,
-        }
 
     def submit_batch(
         self,
@@ -133,8 +129,6 @@ class AnthropicProvider(BaseProvider):
         default_focus: str | None = None,
     ) -> list[Finding]:
         """Synchronous audit (for local CLI use). Submits batch and polls."""
-        import time
-
         batch_id = self.submit_batch(
             files,
             system_prompt,
@@ -143,14 +137,7 @@ class AnthropicProvider(BaseProvider):
         )
         print(f"  Batch submitted: {batch_id}")
 
-        while True:
-            result = self.retrieve_batch(batch_id, default_focus=default_focus)
-            if result["status"] == "ended":
-                return result.get("findings", [])
-
-            processing = result["request_counts"]["processing"]
-            print(f"  Waiting... ({processing} processing)")
-            time.sleep(60)
+        return self._poll_batch(batch_id, default_focus=default_focus)
 
     def _build_user_message(self, files: list[FileContent], decision_context: str) -> str:
         file_contents = self._format_files(files)
@@ -164,7 +151,7 @@ class AnthropicProvider(BaseProvider):
 
 Respond with a JSON object matching this schema:
 ```json
-{json.dumps(FINDING_SCHEMA, indent=2)}
+{_SCHEMA_JSON}
 ```
 
 Return ONLY the JSON object, no other text."""
@@ -182,38 +169,7 @@ Return ONLY the JSON object, no other text."""
     ) -> list[Finding]:
         text = message.content[0].text
 
-        # Extract JSON from response (handle markdown code blocks)
-        if "```json" in text:
-            text = text.split("```json")[1].split("```")[0]
-        elif "```" in text:
-            text = text.split("```")[1].split("```")[0]
+        text = self._strip_code_fence(text)
 
         data = json.loads(text.strip())
-        findings = []
-
-        for f in data.get("findings", []):
-            focus = f.get("focus") or default_focus
-            finding = Finding(
-                id=self._make_finding_id(f),
-                severity=Severity(f["severity"]),
-                file=f["file"],
-                line=f.get("line"),
-                title=f["title"],
-                description=f["description"],
-                suggestion=f.get("suggestion"),
-                focus=focus,
-            )
-            findings.append(finding)
-
-        return findings
-
-    def _make_finding_id(self, raw: dict) -> str:
-        key = f"{raw['file']}:{raw['title']}:{raw.get('line', '')}"
-        # Include focus in hash when present for combined runs
-        if raw.get("focus"):
-            key = f"{raw['focus']}:{key}"
-        return hashlib.sha256(key.encode()).hexdigest()[:12]
-
-    def get_last_usage(self) -> dict:
-        """Return token usage from the last API call."""
-        return self._last_usage
+        return self._build_findings(data, default_focus)
@@ -4,9 +4,26 @@ from __future__ import annotations
 
 import json
 import re
+import time
 from abc import ABC, abstractmethod
+from collections.abc import Mapping
+from hashlib import sha256
+from types import MappingProxyType
 
-from noxaudit.models import FileContent, Finding
+from noxaudit.models import FileContent, Finding, Severity
+
+# Shared read-only usage reported before a provider has made any API call
+_ZERO_USAGE: Mapping[str, int] = MappingProxyType(
+    {
+        "input_tokens": 0,
+        "output_tokens": 0,
+        "cache_read_tokens": 0,
+        "cache_write_tokens": 0,
+    }
+)
+
+# Batch polling backs off from the provider's initial delay up to this cap (seconds)
+_POLL_MAX_DELAY = 60
 
 
 class BaseProvider(ABC):
@@ -14,6 +31,12 @@ class BaseProvider(ABC):
 
     name: str = "base"
 
+    # Replaced (never mutated) by subclasses once a call reports usage
+    _last_usage: Mapping[str, int] = _ZERO_USAGE
+
+    # First wait between batch status checks; at the cap this is a fixed interval
+    _poll_initial_delay: int = _POLL_MAX_DELAY
+
     @abstractmethod
     def run_audit(
         self,
@@ -29,12 +52,53 @@ class BaseProvider(ABC):
 
         Returns dict with keys: input_tokens, output_tokens, cache_read_tokens, cache_write_tokens.
         """
-        return {
-            "input_tokens": 0,
-            "output_tokens": 0,
-            "cache_read_tokens": 0,
-            "cache_write_tokens": 0,
-        }
+        return dict(self._last_usage)
+
+    def _poll_batch(self, batch_id: str, default_focus: str | None = None) -> list[Finding]:
+        """Poll retrieve_batch until the batch ends, backing off exponentially between checks."""
+        delay = self._poll_initial_delay
+        while True:
+            result = self.retrieve_batch(batch_id, default_focus=default_focus)
+            if result["status"] == "ended":
+                return result.get("findings", [])
+
+            processing = result["request_counts"]["processing"]
+            print(f"  Waiting... ({processing} processing)")
+            time.sleep(delay)
+            delay = min(delay * 2, _POLL_MAX_DELAY)
+
+    def _build_findings(self, data: dict, default_focus: str | None = None) -> list[Finding]:
+        """Build Findings from a parsed response, backfilling focus from default_focus."""
+        return [
+            Finding(
+                id=self._make_finding_id(f),
+                severity=Severity(f["severity"]),
+                file=f["file"],
+                line=f.get("line"),
+                title=f["title"],
+                description=f["description"],
+                suggestion=f.get("suggestion"),
+                focus=f.get("focus") or default_focus,
+            )
+            for f in data.get("findings", [])
+        ]
+
+    def _make_finding_id(self, raw: dict) -> str:
+        key = f"{raw['file']}:{raw['title']}:{raw.get('line', '')}"
+        # Include focus in hash when present for combined runs
+        if raw.get("focus"):
+            key = f"{raw['focus']}:{key}"
+        return sha256(key.encode()).hexdigest()[:12]
+
+    @staticmethod
+    def _strip_code_fence(text: str) -> str:
+        """Return the body of the first markdown code block, or text unchanged if none."""
+        # partition stops at the first fence instead of splitting the whole response
+        if "```json" in text:
+            return text.partition("```json")[2].partition("```")[0]
+        if "```" in text:
+            return text.partition("```")[2].partition("```")[0]
+        return text
 
     @staticmethod
     def _safe_json_loads(text: str) -> dict:
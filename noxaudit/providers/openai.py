@@ -2,18 +2,16 @@
 
 from __future__ import annotations
 
-import hashlib
 import io
 import json
 import os
-import time
 
 try:
     import openai
 except ImportError:
     openai = None
 
-from noxaudit.models import FileContent, Finding, Severity
+from noxaudit.models import FileContent, Finding
 from noxaudit.providers.base import BaseProvider
 
 FINDING_SCHEMA = {
@@ -42,12 +40,24 @@ FINDING_SCHEMA = {
     "required": ["findings"],
 }
 
+# Rendered once for the user message rather than on every request
+_SCHEMA_JSON = json.dumps(FINDING_SCHEMA, indent=2)
+
+_RESPONSE_FORMAT = {
+    "type": "json_schema",
+    "json_schema": {
+        "name": "audit_findings",
+        "schema": FINDING_SCHEMA,
+    },
+}
+
 # Terminal batch statuses
 _BATCH_TERMINAL = frozenset({"completed", "failed", "expired", "cancelled"})
 
 
 class OpenAIProvider(BaseProvider):
     name = "openai"
+    _poll_initial_delay = 2
 
     def __init__(self, model: str = "gpt-5.2"):
         if openai is None:
@@ -59,12 +69,6 @@ class OpenAIProvider(BaseProvider):
             raise ValueError("OPENAI_API_KEY environment variable is required")
         self.client = openai.OpenAI(api_key=api_key)
         self.model = model
-        self._last_usage = {
-            "input_tokens": 0,
-            "output_tokens": 0,
-            "cache_read_tokens": 0,
-            "cache_write_tokens": 0,
-        }
 
     def submit_batch(
         self,
@@ -75,6 +79,36 @@ class OpenAIProvider(BaseProvider):
         num_focus_areas: int = 1,
     ) -> str:
         """Submit a batch request via OpenAI Batch API. Returns the batch ID."""
+        jsonl_bytes = self._build_batch_jsonl(
+            files,
+            system_prompt,
+            decision_context,
+            custom_id=custom_id,
+            num_focus_areas=num_focus_areas,
+        )
+
+        batch_file = self.client.files.create(
+            file=io.BytesIO(jsonl_bytes),
+            purpose="batch",
+        )
+
+        batch = self.client.batches.create(
+            input_file_id=batch_file.id,
+            endpoint="/v1/chat/completions",
+            completion_window="24h",
+        )
+
+        return batch.id
+
+    def _build_batch_jsonl(
+        self,
+        files: list[FileContent],
+        system_prompt: str,
+        decision_context: str,
+        custom_id: str = "noxaudit-audit",
+        num_focus_areas: int = 1,
+    ) -> bytes:
+        """Serialize the chat-completions request as the one-line JSONL batch input file."""
         user_message = self._build_user_message(files, decision_context)
         max_tokens = 4096 * num_focus_areas
 
@@ -89,29 +123,10 @@ class OpenAIProvider(BaseProvider):
                     {"role": "system", "content": system_prompt},
                     {"role": "user", "content": user_message},
                 ],
-                "response_format": {
-                    "type": "json_schema",
-                    "json_schema": {
-                        "name": "audit_findings",
-                        "schema": FINDING_SCHEMA,
-                    },
-                },
+                "response_format": _RESPONSE_FORMAT,
             },
         }
-        jsonl_bytes = (json.dumps(request) + "\n").encode("utf-8")
-
-        batch_file = self.client.files.create(
-            file=io.BytesIO(jsonl_bytes),
-            purpose="batch",
-        )
-
-        batch = self.client.batches.create(
-            input_file_id=batch_file.id,
-            endpoint="/v1/chat/completions",
-            completion_window="24h",
-        )
-
-        return batch.id
+        return (json.dumps(request) + "\n").encode("utf-8")
 
     def retrieve_batch(
         self,
@@ -141,8 +156,8 @@ class OpenAIProvider(BaseProvider):
 
         if is_done and batch.error_file_id and not batch.output_file_id:
             # Batch completed with errors, no output
-            err_content = self.client.files.content(batch.error_file_id).read().decode("utf-8")
-            for line in err_content.splitlines():
+            err_content = self.client.files.content(batch.error_file_id)
+            for line in err_content.iter_lines():
                 if not line.strip():
                     continue
                 entry = json.loads(line)
@@ -155,8 +170,8 @@ class OpenAIProvider(BaseProvider):
         if is_done and batch.output_file_id:
             findings = []
             content = self.client.files.content(batch.output_file_id)
-            text = content.read().decode("utf-8")
-            for line in text.splitlines():
+            # Parse record by record rather than decoding and splitting the whole file
+            for line in content.iter_lines():
                 if not line.strip():
                     continue
                 entry = json.loads(line)
@@ -201,14 +216,7 @@ class OpenAIProvider(BaseProvider):
         )
         print(f"  Batch submitted: {batch_id}")
 
-        while True:
-            result = self.retrieve_batch(batch_id, default_focus=default_focus)
-            if result["status"] == "ended":
-                return result.get("findings", [])
-
-            processing = result["request_counts"]["processing"]
-            print(f"  Waiting... ({processing} processing)")
-            time.sleep(60)
+        return self._poll_batch(batch_id, default_focus=default_focus)
 
     def _build_user_message(self, files: list[FileContent], decision_context: str) -> str:
         file_contents = self._format_files(files)
@@ -222,7 +230,7 @@ class OpenAIProvider(BaseProvider):
 
 Respond with a JSON object matching this schema:
 ```json
-{json.dumps(FINDING_SCHEMA, indent=2)}
+{_SCHEMA_JSON}
 ```
 
 Return ONLY the JSON object, no other text."""
@@ -238,37 +246,7 @@ Return ONLY the JSON object, no other text."""
         text: str,
         default_focus: str | None = None,
     ) -> list[Finding]:
-        # Extract JSON from response (handle markdown code blocks)
-        if "```json" in text:
-            text = text.split("```json")[1].split("```")[0]
-        elif "```" in text:
-            text = text.split("```")[1].split("```")[0]
+        text = self._strip_code_fence(text)
 
         data = self._safe_json_loads(text.strip())
-        findings = []
-
-        for f in data.get("findings", []):
-            focus = f.get("focus") or default_focus
-            finding = Finding(
-                id=self._make_finding_id(f),
-                severity=Severity(f["severity"]),
-                file=f["file"],
-                line=f.get("line"),
-                title=f["title"],
-                description=f["description"],
-                suggestion=f.get("suggestion"),
-                focus=focus,
-            )
-            findings.append(finding)
-
-        return findings
-
-    def _make_finding_id(self, raw: dict) -> str:
-        key = f"{raw['file']}:{raw['title']}:{raw.get('line', '')}"
-        if raw.get("focus"):
-            key = f"{raw['focus']}:{key}"
-        return hashlib.sha256(key.encode()).hexdigest()[:12]
-
-    def get_last_usage(self) -> dict:
-        """Return token usage from the last API call."""
-        return self._last_usage
+        return self._build_findings(data, default_focus)
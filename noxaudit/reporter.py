@@ -7,6 +7,24 @@ from pathlib import Path
 
 from noxaudit.models import AuditResult, Severity
 
+# Notification header icon per single focus area; combined runs use the generic one
+_FOCUS_ICONS = {
+    "security": "🔒",
+    "docs": "📝",
+    "patterns": "🏗️",
+    "performance": "⚡",
+    "hygiene": "🧹",
+    "dependencies": "📦",
+}
+_DEFAULT_FOCUS_ICON = "🔍"
+
+# Marker shown next to each of the top findings in a notification
+_SEVERITY_ICONS = {
+    Severity.HIGH: "⚠️",
+    Severity.MEDIUM: "ℹ️",
+    Severity.LOW: "💡",
+}
+
 
 def _focus_display(focus: str) -> str:
     """Format focus string for display: 'security+performance' → 'Security + Performance'."""
@@ -15,11 +33,12 @@ def _focus_display(focus: str) -> str:
 
 def generate_report(result: AuditResult) -> str:
     """Generate a markdown report from audit results."""
+    focus_label = _focus_display(result.focus)
     lines = [
-        f"# Noxaudit Report: {_focus_display(result.focus)}",
+        f"# Noxaudit Report: {focus_label}",
         "",
         f"- **Repo**: {result.repo}",
-        f"- **Focus**: {_focus_display(result.focus)}",
+        f"- **Focus**: {focus_label}",
         f"- **Provider**: {result.provider}",
         f"- **Date**: {result.timestamp}",
         "",
@@ -72,22 +91,15 @@ def save_report(report: str, reports_dir: str | Path, repo: str, focus: str) ->
 
     date_str = datetime.now().strftime("%Y-%m-%d")
     report_file = reports_path / f"{date_str}-{focus}.md"
-    report_file.write_text(report)
+    # Encode explicitly so the report is UTF-8 regardless of the platform's locale encoding
+    report_file.write_bytes(report.encode("utf-8"))
     return report_file
 
 
 def format_notification(result: AuditResult) -> str:
     """Format a short notification message."""
-    focus_icons = {
-        "security": "🔒",
-        "docs": "📝",
-        "patterns": "🏗️",
-        "performance": "⚡",
-        "hygiene": "🧹",
-        "dependencies": "📦",
-    }
     # Use specific icon for single focus, generic for combined
-    icon = focus_icons.get(result.focus, "🔍")
+    icon = _FOCUS_ICONS.get(result.focus, _DEFAULT_FOCUS_ICON)
 
     lines = [
         f"{icon} {_focus_display(result.focus)} Audit — {result.repo}",
@@ -112,8 +124,7 @@ def format_notification(result: AuditResult) -> str:
 
         # Show top 3 findings
         for f in result.new_findings[:3]:
-            sev = {"high": "⚠️", "medium": "ℹ️", "low": "💡"}[f.severity.value]
-            lines.append(f"{sev} {f.title}")
+            lines.append(f"{_SEVERITY_ICONS[f.severity]} {f.title}")
             lines.append(f"   {f.file}")
 
     if result.resolved_count:
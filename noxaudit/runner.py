@@ -15,7 +15,7 @@ from noxaudit.issues import create_issues_for_findings
 from noxaudit.mcp.state import append_findings_history, save_latest_findings
 from noxaudit.models import AuditResult, FileContent
 from noxaudit.notifications.telegram import send_telegram
-from noxaudit.pricing import MODEL_PRICING
+from noxaudit.pricing import MODEL_PRICING, build_estimate_report, resolve_model_key
 from noxaudit.providers.anthropic import AnthropicProvider
 from noxaudit.providers.gemini import GeminiProvider
 from noxaudit.reporter import format_notification, generate_report, save_report
@@ -64,7 +64,7 @@ def _focus_label(names: list[str]) -> str:
 
 def estimate_tokens(files: list[FileContent]) -> int:
     """Estimate token count from files. Rough heuristic: ~4 chars per token."""
-    total_chars = sum(len(f.content) for f in files)
+    total_chars = sum(f.size for f in files)
     return total_chars // 4
 
 
@@ -227,6 +227,52 @@ def run_audit(
     return results
 
 
+def run_estimate(
+    config: NoxauditConfig,
+    repo_name: str | None = None,
+    focus_name: str | None = None,
+    provider_name: str | None = None,
+) -> str:
+    """Build the cost estimate text for the configured repos without calling any API."""
+    focus_names = _resolve_focus_names(focus_name, config)
+    if not focus_names:
+        return ""
+
+    repos = config.repos
+    if repo_name:
+        repos = [r for r in repos if r.name == repo_name]
+        if not repos:
+            raise ValueError(f"Unknown repo: {repo_name}")
+
+    if not repos:
+        return "No repos configured. Add repos to noxaudit.yml."
+
+    sections = []
+    for repo in repos:
+        focus_instances = [FOCUS_AREAS[name]() for name in focus_names]
+        # Only sizes feed the estimate, so skip reading file contents
+        files = gather_files_combined(
+            focus_instances, repo.path, repo.exclude_patterns, with_content=False
+        )
+
+        if not files:
+            sections.append(f"\n  {repo.name}: No files found matching focus areas.")
+            continue
+
+        pname = provider_name or config.get_provider_for_repo(repo.name)
+        sections.append(
+            build_estimate_report(
+                repo_name=repo.name,
+                focus_names=focus_names,
+                files=files,
+                provider_name=pname,
+                model_key=resolve_model_key(pname, config.model),
+            )
+        )
+
+    return "\n".join(sections)
+
+
 def _already_retrieved(pending: dict) -> bool:
     """Check if this batch was already retrieved (idempotency guard)."""
     path = Path(LAST_RETRIEVED_FILE)
@@ -6,8 +6,19 @@ import json
 from datetime import datetime
 from pathlib import Path
 
+from noxaudit.config import ALL_FOCUS_NAMES
 from noxaudit.models import Finding, Severity
 
+# SARIF result level per finding severity
+_SARIF_LEVELS = {
+    Severity.HIGH: "error",
+    Severity.MEDIUM: "warning",
+    Severity.LOW: "note",
+}
+
+# Rule IDs for the built-in focus areas, shared across every result
+_RULE_IDS = {name: f"noxaudit/{name}" for name in [*ALL_FOCUS_NAMES, "general"]}
+
 
 def findings_to_sarif(findings: list[Finding], focus: str, repo: str) -> dict:
     """Convert findings to a SARIF 2.1.0 document.
@@ -21,10 +32,7 @@ def findings_to_sarif(findings: list[Finding], focus: str, repo: str) -> dict:
         A SARIF 2.1.0 run object as a dict
     """
     # Build rules from unique focus areas
-    rule_ids = set()
-    for finding in findings:
-        if finding.focus:
-            rule_ids.add(finding.focus)
+    rule_ids = {finding.focus for finding in findings if finding.focus}
 
     # If no explicit focus in findings, use the focus parameter
     if not rule_ids:
@@ -34,7 +42,7 @@ def findings_to_sarif(findings: list[Finding], focus: str, repo: str) -> dict:
     for rule_id in sorted(rule_ids):
         rules.append(
             {
-                "id": f"noxaudit/{rule_id}",
+                "id": _rule_id(rule_id),
                 "name": rule_id.capitalize(),
                 "shortDescription": {"text": f"{rule_id.capitalize()} audit"},
                 "defaultConfiguration": {"level": "warning"},
@@ -42,10 +50,7 @@ def findings_to_sarif(findings: list[Finding], focus: str, repo: str) -> dict:
         )
 
     # Convert findings to results
-    results = []
-    for finding in findings:
-        result = _finding_to_sarif_result(finding)
-        results.append(result)
+    results = [_finding_to_sarif_result(finding) for finding in findings]
 
     # Build the SARIF run object
     return {
@@ -73,16 +78,10 @@ def findings_to_sarif(findings: list[Finding], focus: str, repo: str) -> dict:
 
 def _finding_to_sarif_result(finding: Finding) -> dict:
     """Convert a single Finding to a SARIF result object."""
-    # Map severity to SARIF level
-    level_map = {
-        Severity.HIGH: "error",
-        Severity.MEDIUM: "warning",
-        Severity.LOW: "note",
-    }
-    level = level_map.get(finding.severity, "warning")
+    level = _SARIF_LEVELS.get(finding.severity, "warning")
 
     # Use focus area as rule ID, default to 'general' if not set
-    rule_id = f"noxaudit/{finding.focus}" if finding.focus else "noxaudit/general"
+    rule_id = _rule_id(finding.focus or "general")
 
     # Build message with title and description
     message_text = finding.title
@@ -138,6 +137,11 @@ def _finding_to_sarif_result(finding: Finding) -> dict:
     return result
 
 
+def _rule_id(focus: str) -> str:
+    """Return the SARIF rule ID for a focus area."""
+    return _RULE_IDS.get(focus) or f"noxaudit/{focus}"
+
+
 def save_sarif(sarif: dict, reports_dir: str | Path, repo: str, focus: str) -> str:
     """Save SARIF JSON to file, return path.
 
@@ -29,6 +29,11 @@ from pathlib import Path
 
 import yaml
 
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:  # PyYAML built without LibYAML
+    from yaml import SafeLoader as _YamlLoader
+
 
 # ---------------------------------------------------------------------------
 # Result schema helpers
@@ -239,7 +244,7 @@ def run_matrix(config_path: Path) -> None:
     Skips combinations whose output file already exists, enabling resume.
     """
     with open(config_path) as f:
-        cfg = yaml.safe_load(f)
+        cfg = yaml.load(f, Loader=_YamlLoader)
 
     # Support both top-level matrix key and flat config
     matrix = cfg.get("matrix", cfg)
@@ -2,71 +2,70 @@
 
 from __future__ import annotations
 
-import textwrap
 from pathlib import Path
 
 import pytest
 
-from noxaudit.models import AuditResult, Finding, Severity
+from noxaudit.cost_ledger import CostLedger
+from noxaudit.models import AuditResult
+from tests.helpers import build_sample_findings
 
 
 @pytest.fixture
-def tmp_repo(tmp_path):
-    """Create a minimal repo structure for file-gathering tests."""
-    (tmp_path / "src").mkdir()
-    (tmp_path / "src" / "app.py").write_text("print('hello')")
-    (tmp_path / "src" / "utils.ts").write_text("export const x = 1;")
-    (tmp_path / "README.md").write_text("# My App")
-    (tmp_path / "package.json").write_text('{"name": "test"}')
-    (tmp_path / "config.yml").write_text("key: value")
-    (tmp_path / "Dockerfile").write_text("FROM python:3.12")
-    (tmp_path / "setup.sh").write_text("#!/bin/bash\necho hi")
-    # Files that should be excluded
-    (tmp_path / "node_modules").mkdir()
-    (tmp_path / "node_modules" / "lib.js").write_text("module.exports = {}")
-    (tmp_path / ".git").mkdir()
-    (tmp_path / ".git" / "config").write_text("[core]")
+def isolated_cwd(tmp_path, monkeypatch):
+    """Run the test from tmp_path so relative .noxaudit/ state never lands in the checkout."""
+    monkeypatch.chdir(tmp_path)
     return tmp_path
 
 
 @pytest.fixture
-def sample_findings():
-    """A list of findings across severities."""
-    return [
-        Finding(
-            id="aaa111",
-            severity=Severity.HIGH,
-            file="src/auth.py",
-            line=42,
-            title="SQL injection",
-            description="User input interpolated into query",
-            suggestion="Use parameterized queries",
-            focus="security",
-        ),
-        Finding(
-            id="bbb222",
-            severity=Severity.MEDIUM,
-            file="src/api.ts",
-            line=10,
-            title="Missing rate limit",
-            description="Endpoint has no rate limiting",
-            focus="security",
-        ),
-        Finding(
-            id="ccc333",
-            severity=Severity.LOW,
-            file="README.md",
-            line=None,
-            title="Stale install instructions",
-            description="README references deprecated CLI flag",
-            focus="docs",
-        ),
-    ]
+def ledger_path(tmp_path, monkeypatch):
+    """Point CostLedger at a fresh ledger file under tmp_path and return its path."""
+    path = tmp_path / ".noxaudit" / "cost-ledger.jsonl"
+    monkeypatch.setattr(CostLedger, "LEDGER_PATH", path)
+    return path
+
+
+def _build_repo(root):
+    """Write a minimal repo structure for file-gathering tests under root."""
+    (root / "src").mkdir()
+    (root / "src" / "app.py").write_text("print('hello')")
+    (root / "src" / "utils.ts").write_text("export const x = 1;")
+    (root / "README.md").write_text("# My App")
+    (root / "package.json").write_text('{"name": "test"}')
+    (root / "config.yml").write_text("key: value")
+    (root / "Dockerfile").write_text("FROM python:3.12")
+    (root / "setup.sh").write_text("#!/bin/bash\necho hi")
+    # Files that should be excluded
+    (root / "node_modules").mkdir()
+    (root / "node_modules" / "lib.js").write_text("module.exports = {}")
+    (root / ".git").mkdir()
+    (root / ".git" / "config").write_text("[core]")
+    return root
 
 
 @pytest.fixture
-def sample_result(sample_findings):
-    """An AuditResult with findings."""
+def tmp_repo(tmp_path):
+    """Create a minimal repo structure for file-gathering tests."""
+    return _build_repo(tmp_path)
+
+
+@pytest.fixture(scope="module")
+def tmp_repo_ro(tmp_path_factory):
+    """The tmp_repo structure built once per module, for tests that never modify it."""
+    return _build_repo(tmp_path_factory.mktemp("repo_ro"))
+
+
+@pytest.fixture(scope="session")
+def sample_findings():
+    """A list of findings across severities. Session-scoped: tests must not mutate it."""
+    return build_sample_findings()
+
+
+@pytest.fixture(scope="session")
+def sample_result():
+    """An AuditResult with findings. Session-scoped: tests must not mutate it."""
+    sample_findings = build_sample_findings()
     return AuditResult(
         repo="my-app",
         focus="security",
@@ -78,9 +77,10 @@ def sample_result(sample_findings):
     )
 
 
-@pytest.fixture
-def combined_result(sample_findings):
-    """An AuditResult from a combined run."""
+@pytest.fixture(scope="session")
+def combined_result():
+    """An AuditResult from a combined run. Session-scoped: tests must not mutate it."""
+    sample_findings = build_sample_findings()
     return AuditResult(
         repo="my-app",
         focus="security+docs",
@@ -94,11 +94,11 @@ def combined_result(sample_findings):
 
 @pytest.fixture
 def tmp_config(tmp_path):
-    """Write a noxaudit.yml and return its path."""
+    """Write a noxaudit.yml and return its path. Content is written verbatim."""
 
     def _write(content: str) -> Path:
         p = tmp_path / "noxaudit.yml"
-        p.write_text(textwrap.dedent(content))
+        p.write_bytes(content.encode())
         return p
 
     return _write
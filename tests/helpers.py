@@ -0,0 +1,57 @@
+"""Plain helpers shared by the test modules (fixtures live in conftest.py)."""
+
+from __future__ import annotations
+
+import yaml
+
+from noxaudit.models import Finding, Severity
+
+try:
+    from yaml import CSafeDumper as _YamlDumper
+except ImportError:  # PyYAML built without LibYAML
+    from yaml import SafeDumper as _YamlDumper
+
+
+def assert_ok(result):
+    """Assert a Click ``CliRunner`` invocation exited cleanly and return it."""
+    assert result.exit_code == 0, result.output
+    return result
+
+
+def dump_yaml(data) -> str:
+    """Serialize test config data to YAML, using LibYAML when available."""
+    return yaml.dump(data, Dumper=_YamlDumper)
+
+
+def build_sample_findings():
+    """A list of findings across severities."""
+    return [
+        Finding(
+            id="aaa111",
+            severity=Severity.HIGH,
+            file="src/auth.py",
+            line=42,
+            title="SQL injection",
+            description="User input interpolated into query",
+            suggestion="Use parameterized queries",
+            focus="security",
+        ),
+        Finding(
+            id="bbb222",
+            severity=Severity.MEDIUM,
+            file="src/api.ts",
+            line=10,
+            title="Missing rate limit",
+            description="Endpoint has no rate limiting",
+            focus="security",
+        ),
+        Finding(
+            id="ccc333",
+            severity=Severity.LOW,
+            file="README.md",
+            line=None,
+            title="Stale install instructions",
+            description="README references deprecated CLI flag",
+            focus="docs",
+        ),
+    ]
@@ -2,92 +2,134 @@
 
 from __future__ import annotations
 
+import json
 
+import pytest
 from click.testing import CliRunner
 
 from noxaudit.cli import main
+from tests.helpers import assert_ok, dump_yaml
 
 
-def _write_config(tmp_path):
-    """Write a minimal config pointing at tmp_path as the repo."""
-    import yaml
-
-    config = {
-        "repos": [{"name": "test-repo", "path": str(tmp_path)}],
-    }
-    cfg_path = tmp_path / "noxaudit.yml"
-    cfg_path.write_text(yaml.dump(config))
-    return str(cfg_path)
+def _config_json(tmp_path):
+    """A minimal inline config pointing at tmp_path as the repo, for --config-json."""
+    return json.dumps({"repos": [{"name": "test-repo", "path": str(tmp_path)}]})
 
 
 class TestStatusCommand:
     def test_shows_focus_areas(self, tmp_path):
-        cfg = _write_config(tmp_path)
+        cfg = _config_json(tmp_path)
         runner = CliRunner()
-        result = runner.invoke(main, ["--config", cfg, "status"])
-        assert result.exit_code == 0
+        result = assert_ok(runner.invoke(main, ["--config-json", cfg, "status"]))
         assert "Focus areas:" in result.output
         assert "test-repo" in result.output
 
+    def test_config_file_still_supported(self, tmp_path):
+        cfg_path = tmp_path / "noxaudit.yml"
+        cfg_path.write_text(dump_yaml({"repos": [{"name": "file-repo", "path": str(tmp_path)}]}))
+        runner = CliRunner()
+        result = assert_ok(runner.invoke(main, ["--config", str(cfg_path), "status"]))
+        assert "file-repo" in result.output
+
+
+class TestConfigJson:
+    @pytest.mark.parametrize(
+        ("raw", "message"),
+        [
+            ("{nope", "not valid JSON"),
+            ("[]", "must be a JSON object"),
+            ('"x"', "must be a JSON object"),
+        ],
+        ids=["invalid-json", "array", "string"],
+    )
+    def test_rejects_bad_value(self, raw, message):
+        result = CliRunner().invoke(main, ["--config-json", raw, "status"])
+        # BadParameter is a usage error: exit code 2, naming the offending option
+        assert result.exit_code == 2
+        assert "--config-json" in result.output
+        assert message in result.output
+
+    def test_deprecated_key_warns_and_defaults_apply(self, tmp_path):
+        raw = json.dumps(
+            {
+                "schedule": {"monday": "security"},
+                "repos": [{"name": "test-repo", "path": str(tmp_path)}],
+            }
+        )
+        with pytest.warns(DeprecationWarning, match="'schedule' config key is deprecated"):
+            result = assert_ok(CliRunner().invoke(main, ["--config-json", raw, "status"]))
+        # Keys the inline config leaves out fall back to the defaults
+        assert f"test-repo: {tmp_path} (gemini)" in result.output
+        assert "Reports: .noxaudit/reports" in result.output
+
+    def test_rejects_both_config_sources(self, tmp_path):
+        result = CliRunner().invoke(
+            main, ["--config", "x.yml", "--config-json", _config_json(tmp_path), "status"]
+        )
+        assert result.exit_code != 0
+        assert "not both" in result.output
+
 
 class TestRunDryRun:
     def test_single_focus(self, tmp_path):
         (tmp_path / "app.py").write_text("x = 1")
-        cfg = _write_config(tmp_path)
+        cfg = _config_json(tmp_path)
         runner = CliRunner()
-        result = runner.invoke(main, ["--config", cfg, "run", "--focus", "security", "--dry-run"])
-        assert result.exit_code == 0
+        result = assert_ok(
+            runner.invoke(main, ["--config-json", cfg, "run", "--focus", "security", "--dry-run"])
+        )
         assert "DRY RUN" in result.output
         assert "1 focus area" in result.output
 
     def test_combined_focus(self, tmp_path):
         (tmp_path / "app.py").write_text("x = 1")
-        cfg = _write_config(tmp_path)
+        cfg = _config_json(tmp_path)
         runner = CliRunner()
-        result = runner.invoke(
-            main, ["--config", cfg, "run", "--focus", "security,docs", "--dry-run"]
+        result = assert_ok(
+            runner.invoke(
+                main, ["--config-json", cfg, "run", "--focus", "security,docs", "--dry-run"]
+            )
         )
-        assert result.exit_code == 0
         assert "DRY RUN" in result.output
         assert "2 focus area" in result.output
         assert "security+docs" in result.output
 
     def test_all_focus(self, tmp_path):
         (tmp_path / "app.py").write_text("x = 1")
-        cfg = _write_config(tmp_path)
+        cfg = _config_json(tmp_path)
         runner = CliRunner()
-        result = runner.invoke(main, ["--config", cfg, "run", "--focus", "all", "--dry-run"])
-        assert result.exit_code == 0
+        result = assert_ok(
+            runner.invoke(main, ["--config-json", cfg, "run", "--focus", "all", "--dry-run"])
+        )
         assert "7 focus area" in result.output
 
     def test_no_focus_defaults_to_all(self, tmp_path):
         (tmp_path / "app.py").write_text("x = 1")
-        cfg = _write_config(tmp_path)
+        cfg = _config_json(tmp_path)
         runner = CliRunner()
-        result = runner.invoke(main, ["--config", cfg, "run", "--dry-run"])
-        assert result.exit_code == 0
+        result = assert_ok(runner.invoke(main, ["--config-json", cfg, "run", "--dry-run"]))
         assert "7 focus area" in result.output
 
     def test_unknown_focus_errors(self, tmp_path):
-        cfg = _write_config(tmp_path)
+        cfg = _config_json(tmp_path)
         runner = CliRunner()
-        result = runner.invoke(main, ["--config", cfg, "run", "--focus", "bogus", "--dry-run"])
+        result = runner.invoke(main, ["--config-json", cfg, "run", "--focus", "bogus", "--dry-run"])
         assert result.exit_code != 0
 
     def test_off_focus(self, tmp_path):
-        cfg = _write_config(tmp_path)
+        cfg = _config_json(tmp_path)
         runner = CliRunner()
-        result = runner.invoke(main, ["--config", cfg, "run", "--focus", "off", "--dry-run"])
-        assert result.exit_code == 0
+        assert_ok(runner.invoke(main, ["--config-json", cfg, "run", "--focus", "off", "--dry-run"]))
 
 
 class TestSubmitDryRun:
     def test_single_focus(self, tmp_path):
         (tmp_path / "app.py").write_text("x = 1")
-        cfg = _write_config(tmp_path)
+        cfg = _config_json(tmp_path)
         runner = CliRunner()
-        result = runner.invoke(
-            main, ["--config", cfg, "submit", "--focus", "security", "--dry-run"]
+        result = assert_ok(
+            runner.invoke(
+                main, ["--config-json", cfg, "submit", "--focus", "security", "--dry-run"]
+            )
         )
-        assert result.exit_code == 0
         assert "DRY RUN" in result.output
@@ -9,54 +9,110 @@ See CONTRIBUTING.md for the policy.
 
 from __future__ import annotations
 
-from datetime import datetime, timedelta
+import json
+import re
+from datetime import date, datetime, timedelta
 from pathlib import Path
 from unittest.mock import MagicMock, patch
 
 import pytest
-import yaml
 from click.testing import CliRunner
 
+import noxaudit.runner as runner_mod
 from noxaudit.cli import main
 from noxaudit.cost_ledger import CostLedger
 from noxaudit.decisions import save_decision
 from noxaudit.models import Decision, DecisionType, Finding, Severity
+from tests.helpers import assert_ok, dump_yaml
+
+# Runs write the ledger and findings history under ./.noxaudit
+pytestmark = pytest.mark.usefixtures("isolated_cwd")
 
 
 # ---------------------------------------------------------------------------
 # Helpers
 # ---------------------------------------------------------------------------
 
+_PROJECTED_LINE = re.compile(r"^.*Projected monthly:.*$", re.M)
+_SPEND_LINE = re.compile(r"^.*Estimated spend:.*$", re.M)
 
-def _write_config(tmp_path: Path, provider: str = "gemini") -> str:
-    """Write a minimal noxaudit.yml and return its path."""
+
+_STUB = "x = 1\n"
+
+
+def _make_repo(tmp_path: Path, extra: dict[str, str] | None = None) -> Path:
+    """Create ``tmp_path/repo`` holding a stub ``app.py`` plus any ``extra`` files."""
     repo_path = tmp_path / "repo"
     repo_path.mkdir()
-    (repo_path / "app.py").write_text("x = 1\n")
+    for name, content in {"app.py": _STUB, **(extra or {})}.items():
+        (repo_path / name).write_text(content, newline="")
+    return repo_path
+
+
+def _write_config(tmp_path: Path, provider: str = "gemini") -> str:
+    """Write a minimal noxaudit.yml and return its path.
 
+    YAML is a superset of JSON, so configs are emitted with ``json.dumps``.
+    """
+    repo_path = _make_repo(tmp_path)
     config = {
         "repos": [{"name": "test-repo", "path": str(repo_path), "provider": provider}],
         "reports_dir": str(tmp_path / "reports"),
     }
+
     cfg_path = tmp_path / "noxaudit.yml"
-    cfg_path.write_text(yaml.dump(config))
+    cfg_path.write_text(json.dumps(config))
     return str(cfg_path)
 
 
-def _make_mock_provider(findings=None):
-    """Return (provider_class_mock, provider_instance_mock)."""
-    if findings is None:
-        findings = []
-    instance = MagicMock()
-    instance.run_audit.return_value = findings
-    instance.get_last_usage.return_value = {
-        "input_tokens": 100,
-        "output_tokens": 50,
-        "cache_read_tokens": 0,
-        "cache_write_tokens": 0,
-    }
-    cls = MagicMock(return_value=instance)
-    return cls, instance
+class _StubProvider:
+    """Hand-written provider double: returns queued findings and records calls."""
+
+    def __init__(self, responses):
+        self._responses = iter(responses)
+        self.run_audit_calls: list[tuple] = []
+
+    def run_audit(self, files, *args, **kwargs):
+        self.run_audit_calls.append((files, args, kwargs))
+        return next(self._responses)
+
+    def get_last_usage(self) -> dict:
+        return {
+            "input_tokens": 100,
+            "output_tokens": 50,
+            "cache_read_tokens": 0,
+            "cache_write_tokens": 0,
+        }
+
+
+_NO_FINDINGS: tuple = ()
+
+
+def _make_mock_provider(*responses):
+    """Return (provider_factory, provider_instance).
+
+    Each call to ``run_audit`` returns the next entry of ``responses``;
+    with no responses, a single audit returns no findings.
+    """
+    instance = _StubProvider(responses or (_NO_FINDINGS,))
+    return (lambda *args, **kwargs: instance), instance
+
+
+_TODAY = date.today().isoformat()
+
+
+def _mk_baseline(finding_id: str, *, focus="security", severity="high", repo=None) -> Decision:
+    """Build a baseline decision as `noxaudit baseline` would store it."""
+    return Decision(
+        finding_id=finding_id,
+        decision=DecisionType.DISMISSED,
+        reason="baseline",
+        date=_TODAY,
+        by="baseline",
+        focus=focus,
+        severity=severity,
+        repo=repo,
+    )
 
 
 # ---------------------------------------------------------------------------
@@ -68,11 +124,9 @@ def _make_mock_provider(findings=None):
 class TestPrepassCLIIntegration:
     """Pre-pass classification is executed when triggered by config or provider economics."""
 
-    def test_prepass_runs_when_enabled_via_config(self, tmp_path, sample_findings):
+    def test_prepass_runs_when_enabled_via_config(self, tmp_path, sample_findings, monkeypatch):
         """When prepass.enabled=True and tokens exceed threshold, pre-pass executes."""
-        repo_path = tmp_path / "repo"
-        repo_path.mkdir()
-        (repo_path / "app.py").write_text("x = 1\n")
+        repo_path = _make_repo(tmp_path)
 
         # Write config with prepass explicitly enabled (low threshold so it triggers)
         config = {
@@ -82,7 +136,7 @@ class TestPrepassCLIIntegration:
             "prepass": {"enabled": True, "threshold_tokens": 0},
         }
         cfg_path = tmp_path / "noxaudit.yml"
-        cfg_path.write_text(yaml.dump(config))
+        cfg_path.write_text(json.dumps(config))
 
         # Provider returns classification findings first (pre-pass), then audit findings
         prepass_findings = [
@@ -96,32 +150,27 @@ class TestPrepassCLIIntegration:
                 focus="security",
             )
         ]
-        provider_cls, provider_instance = _make_mock_provider(sample_findings)
         # First call = prepass classification, second call = main audit
-        provider_instance.run_audit.side_effect = [prepass_findings, sample_findings]
+        provider_cls, provider_instance = _make_mock_provider(prepass_findings, sample_findings)
+
+        monkeypatch.setitem(runner_mod.PROVIDERS, "anthropic", provider_cls)
+        monkeypatch.setitem(runner_mod.PROVIDERS, "gemini", provider_cls)
 
         runner = CliRunner()
-        with (
-            patch.dict(
-                "noxaudit.runner.PROVIDERS", {"anthropic": provider_cls, "gemini": provider_cls}
-            ),
-            patch("noxaudit.runner.save_latest_findings"),
-        ):
-            result = runner.invoke(
-                main,
-                ["--config", str(cfg_path), "run", "--focus", "security"],
+        with patch("noxaudit.runner.save_latest_findings"):
+            assert_ok(
+                runner.invoke(
+                    main,
+                    ["--config", str(cfg_path), "run", "--focus", "security"],
+                )
             )
 
-        assert result.exit_code == 0, result.output
         # Pre-pass was triggered — run_audit called twice (pre-pass + main audit)
-        assert provider_instance.run_audit.call_count == 2
+        assert len(provider_instance.run_audit_calls) == 2
 
-    def test_prepass_filters_files_before_main_audit(self, tmp_path):
+    def test_prepass_filters_files_before_main_audit(self, tmp_path, monkeypatch):
         """Pre-pass result is used to filter files — main audit gets fewer files."""
-        repo_path = tmp_path / "repo"
-        repo_path.mkdir()
-        (repo_path / "app.py").write_text("x = 1\n")
-        (repo_path / "unused.py").write_text("pass\n")
+        repo_path = _make_repo(tmp_path, {"unused.py": "pass\n"})
 
         config = {
             "repos": [{"name": "test-repo", "path": str(repo_path)}],
@@ -130,7 +179,7 @@ class TestPrepassCLIIntegration:
             "prepass": {"enabled": True, "threshold_tokens": 0},
         }
         cfg_path = tmp_path / "noxaudit.yml"
-        cfg_path.write_text(yaml.dump(config))
+        cfg_path.write_text(json.dumps(config))
 
         # Pre-pass returns only app.py as relevant
         prepass_findings = [
@@ -145,34 +194,29 @@ class TestPrepassCLIIntegration:
         ]
         main_findings: list[Finding] = []
 
-        provider_cls, provider_instance = _make_mock_provider([])
-        provider_instance.run_audit.side_effect = [prepass_findings, main_findings]
+        provider_cls, provider_instance = _make_mock_provider(prepass_findings, main_findings)
+
+        monkeypatch.setitem(runner_mod.PROVIDERS, "anthropic", provider_cls)
+        monkeypatch.setitem(runner_mod.PROVIDERS, "gemini", provider_cls)
 
         runner = CliRunner()
-        with (
-            patch.dict(
-                "noxaudit.runner.PROVIDERS", {"anthropic": provider_cls, "gemini": provider_cls}
-            ),
-            patch("noxaudit.runner.save_latest_findings"),
-        ):
-            result = runner.invoke(
-                main,
-                ["--config", str(cfg_path), "run", "--focus", "security"],
+        with patch("noxaudit.runner.save_latest_findings"):
+            assert_ok(
+                runner.invoke(
+                    main,
+                    ["--config", str(cfg_path), "run", "--focus", "security"],
+                )
             )
 
-        assert result.exit_code == 0, result.output
         # Main audit call should only receive app.py (unused.py filtered out)
-        main_audit_call = provider_instance.run_audit.call_args_list[1]
-        files_sent = main_audit_call[0][0]  # first positional arg = files
+        files_sent = provider_instance.run_audit_calls[1][0]  # first positional arg = files
         file_paths = [f.path for f in files_sent]
         assert "app.py" in file_paths
         assert "unused.py" not in file_paths
 
-    def test_prepass_not_triggered_for_gemini(self, tmp_path, sample_findings):
+    def test_prepass_not_triggered_for_gemini(self, tmp_path, monkeypatch):
         """Gemini (flat pricing) does NOT auto-trigger pre-pass."""
-        repo_path = tmp_path / "repo"
-        repo_path.mkdir()
-        (repo_path / "app.py").write_text("x = 1\n")
+        repo_path = _make_repo(tmp_path)
 
         config = {
             "repos": [{"name": "test-repo", "path": str(repo_path), "provider": "gemini"}],
@@ -180,23 +224,23 @@ class TestPrepassCLIIntegration:
             "model": "gemini-2.5-flash",
         }
         cfg_path = tmp_path / "noxaudit.yml"
-        cfg_path.write_text(yaml.dump(config))
+        cfg_path.write_text(json.dumps(config))
+
+        provider_cls, provider_instance = _make_mock_provider()
 
-        provider_cls, provider_instance = _make_mock_provider(sample_findings)
+        monkeypatch.setitem(runner_mod.PROVIDERS, "gemini", provider_cls)
 
         runner = CliRunner()
-        with (
-            patch.dict("noxaudit.runner.PROVIDERS", {"gemini": provider_cls}),
-            patch("noxaudit.runner.save_latest_findings"),
-        ):
-            result = runner.invoke(
-                main,
-                ["--config", str(cfg_path), "run", "--focus", "security"],
+        with patch("noxaudit.runner.save_latest_findings"):
+            assert_ok(
+                runner.invoke(
+                    main,
+                    ["--config", str(cfg_path), "run", "--focus", "security"],
+                )
             )
 
-        assert result.exit_code == 0, result.output
         # No pre-pass triggered — run_audit called exactly once
-        assert provider_instance.run_audit.call_count == 1
+        assert len(provider_instance.run_audit_calls) == 1
 
 
 # ---------------------------------------------------------------------------
@@ -204,146 +248,137 @@ class TestPrepassCLIIntegration:
 # ---------------------------------------------------------------------------
 
 
+@pytest.fixture(scope="class")
+def class_tmp(tmp_path_factory):
+    """A tmp dir shared by every test in a class."""
+    return tmp_path_factory.mktemp("cli_cls")
+
+
+@pytest.fixture(scope="class")
+def cfg(class_tmp):
+    """Config written once per class — read-only status tests never change it."""
+    return _write_config(class_tmp)
+
+
 @pytest.mark.cli_integration
 class TestCostTrackingCLIIntegration:
     """Cost tracking data is correctly displayed in noxaudit status."""
 
-    def test_status_shows_no_history_when_ledger_empty(self, tmp_path):
+    def test_status_shows_no_history_when_ledger_empty(self, cfg, ledger_path):
         """status command shows 'No audit history yet' when ledger is empty."""
-        cfg = _write_config(tmp_path)
-        ledger_path = tmp_path / ".noxaudit" / "cost-ledger.jsonl"
-
-        with patch.object(CostLedger, "LEDGER_PATH", ledger_path):
-            result = CliRunner().invoke(main, ["--config", cfg, "status"])
+        result = assert_ok(CliRunner().invoke(main, ["--config", cfg, "status"]))
 
-        assert result.exit_code == 0, result.output
         assert "No audit history yet" in result.output
 
-    def test_status_shows_spend_and_projections(self, tmp_path):
-        """status command shows spend, avg, and projected monthly."""
-        cfg = _write_config(tmp_path)
-        ledger_path = tmp_path / ".noxaudit" / "cost-ledger.jsonl"
+    def test_status_loads_yaml_emitted_config(self, tmp_path, ledger_path):
+        """A config written by a real YAML emitter is accepted too."""
+        repo_path = tmp_path / "repo"
+        repo_path.mkdir()
+        config = {
+            "repos": [{"name": "test-repo", "path": str(repo_path)}],
+            "reports_dir": str(tmp_path / "reports"),
+        }
+        cfg_path = tmp_path / "noxaudit.yml"
+        cfg_path.write_text(dump_yaml(config))
 
-        with patch.object(CostLedger, "LEDGER_PATH", ledger_path):
-            CostLedger.append_entry(
-                repo="test-repo",
-                focus="security",
-                provider="gemini",
-                model="gemini-2.0-flash",
-                input_tokens=10_000,
-                output_tokens=5_000,
-                cache_read_tokens=0,
-                cache_write_tokens=0,
-                file_count=5,
-            )
-            result = CliRunner().invoke(main, ["--config", cfg, "status"])
+        result = assert_ok(CliRunner().invoke(main, ["--config", str(cfg_path), "status"]))
+
+        assert "test-repo" in result.output
+
+    def test_status_shows_spend_and_projections(self, cfg, ledger_path):
+        """status command shows spend, avg, and projected monthly."""
+        CostLedger.append_entry(
+            repo="test-repo",
+            focus="security",
+            provider="gemini",
+            model="gemini-2.0-flash",
+            input_tokens=10_000,
+            output_tokens=5_000,
+            cache_read_tokens=0,
+            cache_write_tokens=0,
+            file_count=5,
+        )
+        result = assert_ok(CliRunner().invoke(main, ["--config", cfg, "status"]))
 
-        assert result.exit_code == 0, result.output
         assert "Estimated spend:" in result.output
         assert "Avg per audit:" in result.output
         assert "Projected monthly:" in result.output
 
-    def test_status_shows_cache_tokens_when_present(self, tmp_path):
+    def test_status_shows_cache_tokens_when_present(self, cfg, ledger_path):
         """status command shows cache read/write tokens when non-zero."""
-        cfg = _write_config(tmp_path)
-        ledger_path = tmp_path / ".noxaudit" / "cost-ledger.jsonl"
-
-        with patch.object(CostLedger, "LEDGER_PATH", ledger_path):
-            CostLedger.append_entry(
-                repo="test-repo",
-                focus="security",
-                provider="anthropic",
-                model="claude-sonnet-4-6",
-                input_tokens=10_000,
-                output_tokens=5_000,
-                cache_read_tokens=50_000,
-                cache_write_tokens=10_000,
-                file_count=5,
-            )
-            result = CliRunner().invoke(main, ["--config", cfg, "status"])
+        CostLedger.append_entry(
+            repo="test-repo",
+            focus="security",
+            provider="anthropic",
+            model="claude-sonnet-4-6",
+            input_tokens=10_000,
+            output_tokens=5_000,
+            cache_read_tokens=50_000,
+            cache_write_tokens=10_000,
+            file_count=5,
+        )
+        result = assert_ok(CliRunner().invoke(main, ["--config", cfg, "status"]))
 
-        assert result.exit_code == 0, result.output
         assert "Cache read tokens:" in result.output
         assert "Cache write tokens:" in result.output
         assert "Cache savings:" in result.output
 
-    def test_status_projected_monthly_uses_actual_days(self, tmp_path):
+    def test_status_projected_monthly_uses_actual_days(self, cfg, ledger_path):
         """Projected monthly is scaled by actual days with data, not hardcoded 30."""
-        cfg = _write_config(tmp_path)
-        ledger_path = tmp_path / ".noxaudit" / "cost-ledger.jsonl"
         now = datetime.now()
 
-        with patch.object(CostLedger, "LEDGER_PATH", ledger_path):
-            # Two entries: today and 9 days ago → 9 days span
-            CostLedger.append_entry(
-                repo="test-repo",
-                focus="security",
-                provider="gemini",
-                model="gemini-2.0-flash",
-                input_tokens=1_000_000,
-                output_tokens=100_000,
-                cache_read_tokens=0,
-                cache_write_tokens=0,
-                file_count=10,
-                timestamp=(now - timedelta(days=9)).isoformat(),
-            )
-            CostLedger.append_entry(
-                repo="test-repo",
-                focus="security",
-                provider="gemini",
-                model="gemini-2.0-flash",
-                input_tokens=1_000_000,
-                output_tokens=100_000,
-                cache_read_tokens=0,
-                cache_write_tokens=0,
-                file_count=10,
-                timestamp=now.isoformat(),
-            )
-            entries = CostLedger.get_last_n_days(30)
-            total_cost = sum(e.get("cost_estimate_usd", 0) for e in entries)
+        # Two entries: today and 9 days ago → 9 days span
+        base = {
+            "repo": "test-repo",
+            "focus": "security",
+            "provider": "gemini",
+            "model": "gemini-2.0-flash",
+            "input_tokens": 1_000_000,
+            "output_tokens": 100_000,
+            "cache_read_tokens": 0,
+            "cache_write_tokens": 0,
+            "file_count": 10,
+        }
+        CostLedger.append_entries(
+            [
+                {**base, "timestamp": (now - timedelta(days=9)).isoformat()},
+                {**base, "timestamp": now.isoformat()},
+            ]
+        )
+        entries = CostLedger.get_last_n_days(30)
+        total_cost = sum(e.get("cost_estimate_usd", 0) for e in entries)
 
-            result = CliRunner().invoke(main, ["--config", cfg, "status"])
+        result = assert_ok(CliRunner().invoke(main, ["--config", cfg, "status"]))
 
-        assert result.exit_code == 0, result.output
         assert "Projected monthly:" in result.output
-        # Extract projected value from output
-        for line in result.output.splitlines():
-            if "Projected monthly:" in line:
-                # Should be significantly higher than total (9-day data projected to 30 days)
-                assert f"${total_cost:.2f}" not in line, (
-                    "Projected monthly must differ from total when data spans < 30 days"
-                )
-                break
+        # Should be significantly higher than total (9-day data projected to 30 days)
+        m = _PROJECTED_LINE.search(result.output)
+        assert m and f"${total_cost:.2f}" not in m.group(0), (
+            "Projected monthly must differ from total when data spans < 30 days"
+        )
 
-    def test_status_reprices_cache_costs_for_anthropic(self, tmp_path):
+    def test_status_reprices_cache_costs_for_anthropic(self, cfg, ledger_path):
         """status command reprices costs including cache tokens for Anthropic entries."""
-        cfg = _write_config(tmp_path)
-        ledger_path = tmp_path / ".noxaudit" / "cost-ledger.jsonl"
-
-        with patch.object(CostLedger, "LEDGER_PATH", ledger_path):
-            # An entry with cache write tokens — cost must include cache write charges
-            CostLedger.append_entry(
-                repo="test-repo",
-                focus="security",
-                provider="anthropic",
-                model="claude-sonnet-4-6",
-                input_tokens=0,
-                output_tokens=0,
-                cache_read_tokens=0,
-                cache_write_tokens=1_000_000,
-                file_count=5,
-            )
-            result = CliRunner().invoke(main, ["--config", cfg, "status"])
+        # An entry with cache write tokens — cost must include cache write charges
+        CostLedger.append_entry(
+            repo="test-repo",
+            focus="security",
+            provider="anthropic",
+            model="claude-sonnet-4-6",
+            input_tokens=0,
+            output_tokens=0,
+            cache_read_tokens=0,
+            cache_write_tokens=1_000_000,
+            file_count=5,
+        )
+        result = assert_ok(CliRunner().invoke(main, ["--config", cfg, "status"]))
 
-        assert result.exit_code == 0, result.output
         # 1M cache write * $3.75/M * 50% batch discount = $1.875, rounds to $1.88
         assert "$0.00" not in result.output or "Estimated spend:     $0.00" not in result.output
         assert "Estimated spend:" in result.output
         # The cost should be non-zero (cache writes have a real cost)
-        for line in result.output.splitlines():
-            if "Estimated spend:" in line:
-                assert "$0.00" not in line, "Cache write tokens must be included in cost"
-                break
+        m = _SPEND_LINE.search(result.output)
+        assert m and "$0.00" not in m.group(0), "Cache write tokens must be included in cost"
 
 
 # ---------------------------------------------------------------------------
@@ -355,45 +390,17 @@ class TestCostTrackingCLIIntegration:
 class TestBaselineUndoFiltersCLIIntegration:
     """baseline --undo with filters uses stored decisions, not latest-findings.json."""
 
-    def test_undo_with_focus_filter_uses_stored_decisions(self, tmp_path, monkeypatch):
+    def test_undo_with_focus_filter_uses_stored_decisions(self, tmp_path):
         """--undo --focus filters baseline decisions by stored focus field."""
-        monkeypatch.chdir(tmp_path)
         decisions_path = tmp_path / ".noxaudit" / "decisions.jsonl"
         decisions_path.parent.mkdir(parents=True, exist_ok=True)
 
         # Create baseline decisions WITH focus stored (new format)
-        from datetime import date
-
-        save_decision(
-            decisions_path,
-            Decision(
-                finding_id="aaa",
-                decision=DecisionType.DISMISSED,
-                reason="baseline",
-                date=date.today().isoformat(),
-                by="baseline",
-                focus="security",
-                severity="high",
-                repo=None,
-            ),
-        )
-        save_decision(
-            decisions_path,
-            Decision(
-                finding_id="bbb",
-                decision=DecisionType.DISMISSED,
-                reason="baseline",
-                date=date.today().isoformat(),
-                by="baseline",
-                focus="docs",
-                severity="low",
-                repo=None,
-            ),
-        )
+        save_decision(decisions_path, _mk_baseline("aaa"))
+        save_decision(decisions_path, _mk_baseline("bbb", focus="docs", severity="low"))
 
-        result = CliRunner().invoke(main, ["baseline", "--undo", "--focus", "security"])
+        result = assert_ok(CliRunner().invoke(main, ["baseline", "--undo", "--focus", "security"]))
 
-        assert result.exit_code == 0, result.output
         assert "Removed 1 baseline decisions" in result.output
 
         # Only "docs" baseline should remain
@@ -403,44 +410,16 @@ class TestBaselineUndoFiltersCLIIntegration:
         assert len(remaining) == 1
         assert remaining[0].finding_id == "bbb"
 
-    def test_undo_with_severity_filter_uses_stored_decisions(self, tmp_path, monkeypatch):
+    def test_undo_with_severity_filter_uses_stored_decisions(self, tmp_path):
         """--undo --severity filters baseline decisions by stored severity field."""
-        monkeypatch.chdir(tmp_path)
         decisions_path = tmp_path / ".noxaudit" / "decisions.jsonl"
         decisions_path.parent.mkdir(parents=True, exist_ok=True)
 
-        from datetime import date
+        save_decision(decisions_path, _mk_baseline("aaa"))
+        save_decision(decisions_path, _mk_baseline("bbb", severity="low"))
 
-        save_decision(
-            decisions_path,
-            Decision(
-                finding_id="aaa",
-                decision=DecisionType.DISMISSED,
-                reason="baseline",
-                date=date.today().isoformat(),
-                by="baseline",
-                focus="security",
-                severity="high",
-                repo=None,
-            ),
-        )
-        save_decision(
-            decisions_path,
-            Decision(
-                finding_id="bbb",
-                decision=DecisionType.DISMISSED,
-                reason="baseline",
-                date=date.today().isoformat(),
-                by="baseline",
-                focus="security",
-                severity="low",
-                repo=None,
-            ),
-        )
-
-        result = CliRunner().invoke(main, ["baseline", "--undo", "--severity", "high"])
+        result = assert_ok(CliRunner().invoke(main, ["baseline", "--undo", "--severity", "high"]))
 
-        assert result.exit_code == 0, result.output
         assert "Removed 1 baseline decisions" in result.output
 
         from noxaudit.decisions import load_decisions
@@ -449,44 +428,16 @@ class TestBaselineUndoFiltersCLIIntegration:
         assert len(remaining) == 1
         assert remaining[0].finding_id == "bbb"
 
-    def test_undo_with_repo_filter_uses_stored_decisions(self, tmp_path, monkeypatch):
+    def test_undo_with_repo_filter_uses_stored_decisions(self, tmp_path):
         """--undo --repo filters baseline decisions by stored repo field."""
-        monkeypatch.chdir(tmp_path)
         decisions_path = tmp_path / ".noxaudit" / "decisions.jsonl"
         decisions_path.parent.mkdir(parents=True, exist_ok=True)
 
-        from datetime import date
-
-        save_decision(
-            decisions_path,
-            Decision(
-                finding_id="aaa",
-                decision=DecisionType.DISMISSED,
-                reason="baseline",
-                date=date.today().isoformat(),
-                by="baseline",
-                focus="security",
-                severity="high",
-                repo="my-app",
-            ),
-        )
-        save_decision(
-            decisions_path,
-            Decision(
-                finding_id="bbb",
-                decision=DecisionType.DISMISSED,
-                reason="baseline",
-                date=date.today().isoformat(),
-                by="baseline",
-                focus="security",
-                severity="high",
-                repo="other-app",
-            ),
-        )
+        save_decision(decisions_path, _mk_baseline("aaa", repo="my-app"))
+        save_decision(decisions_path, _mk_baseline("bbb", repo="other-app"))
 
-        result = CliRunner().invoke(main, ["baseline", "--undo", "--repo", "my-app"])
+        result = assert_ok(CliRunner().invoke(main, ["baseline", "--undo", "--repo", "my-app"]))
 
-        assert result.exit_code == 0, result.output
         assert "Removed 1 baseline decisions" in result.output
 
         from noxaudit.decisions import load_decisions
@@ -495,46 +446,27 @@ class TestBaselineUndoFiltersCLIIntegration:
         assert len(remaining) == 1
         assert remaining[0].finding_id == "bbb"
 
-    def test_undo_filters_work_without_latest_findings_json(self, tmp_path, monkeypatch):
+    def test_undo_filters_work_without_latest_findings_json(self, tmp_path):
         """--undo --focus works even when latest-findings.json does not exist."""
-        monkeypatch.chdir(tmp_path)
         decisions_path = tmp_path / ".noxaudit" / "decisions.jsonl"
         decisions_path.parent.mkdir(parents=True, exist_ok=True)
 
-        from datetime import date
-
-        save_decision(
-            decisions_path,
-            Decision(
-                finding_id="aaa",
-                decision=DecisionType.DISMISSED,
-                reason="baseline",
-                date=date.today().isoformat(),
-                by="baseline",
-                focus="security",
-                severity="high",
-                repo=None,
-            ),
-        )
+        save_decision(decisions_path, _mk_baseline("aaa"))
 
         # No latest-findings.json exists — old code would return 0 removals
         assert not (tmp_path / ".noxaudit" / "latest-findings.json").exists()
 
-        result = CliRunner().invoke(main, ["baseline", "--undo", "--focus", "security"])
+        result = assert_ok(CliRunner().invoke(main, ["baseline", "--undo", "--focus", "security"]))
 
-        assert result.exit_code == 0, result.output
         # Fixed code filters from stored decisions — finds and removes the security baseline
         assert "Removed 1 baseline decisions" in result.output
 
-    def test_baseline_create_stores_focus_severity_repo(self, tmp_path, monkeypatch):
+    def test_baseline_create_stores_focus_severity_repo(self, tmp_path):
         """baseline command stores focus/severity/repo in decisions for later filtering."""
-        monkeypatch.chdir(tmp_path)
 
         # Write latest-findings.json with a finding
         noxaudit_dir = tmp_path / ".noxaudit"
         noxaudit_dir.mkdir(exist_ok=True)
-        import json
-
         data = {
             "repo": "my-app",
             "focus": "security",
@@ -554,9 +486,8 @@ class TestBaselineUndoFiltersCLIIntegration:
         }
         (noxaudit_dir / "latest-findings.json").write_text(json.dumps(data))
 
-        result = CliRunner().invoke(main, ["baseline"])
+        result = assert_ok(CliRunner().invoke(main, ["baseline"]))
 
-        assert result.exit_code == 0, result.output
         assert "Baselined 1" in result.output
 
         from noxaudit.decisions import load_decisions
@@ -578,9 +509,7 @@ class TestGeminiBatchCLIIntegration:
     """submit and retrieve CLI commands work end-to-end with a mocked GeminiProvider."""
 
     def _write_gemini_config(self, tmp_path: Path) -> str:
-        repo_path = tmp_path / "repo"
-        repo_path.mkdir()
-        (repo_path / "app.py").write_text("x = 1\n")
+        repo_path = _make_repo(tmp_path)
 
         config = {
             "repos": [{"name": "test-repo", "path": str(repo_path), "provider": "gemini"}],
@@ -588,29 +517,28 @@ class TestGeminiBatchCLIIntegration:
             "model": "gemini-2.5-flash",
         }
         cfg_path = tmp_path / "noxaudit.yml"
-        cfg_path.write_text(yaml.dump(config))
+        cfg_path.write_text(json.dumps(config))
         return str(cfg_path)
 
     def test_submit_wires_to_gemini_submit_batch(self, tmp_path, monkeypatch):
         """noxaudit submit calls GeminiProvider.submit_batch and saves batch ID."""
-        monkeypatch.chdir(tmp_path)
         cfg = self._write_gemini_config(tmp_path)
 
         instance = MagicMock()
         instance.submit_batch.return_value = "batches/gemini-job-001"
         provider_cls = MagicMock(return_value=instance)
 
+        monkeypatch.setitem(runner_mod.PROVIDERS, "gemini", provider_cls)
+
         runner = CliRunner()
-        with (
-            patch.dict("noxaudit.runner.PROVIDERS", {"gemini": provider_cls}),
-        ):
-            result = runner.invoke(
+        result = assert_ok(
+            runner.invoke(
                 main,
                 ["--config", cfg, "submit", "--focus", "security"],
                 catch_exceptions=False,
             )
+        )
 
-        assert result.exit_code == 0, result.output
         instance.submit_batch.assert_called_once()
         # Batch ID should appear in output or be saved to pending file
         assert (
@@ -621,12 +549,9 @@ class TestGeminiBatchCLIIntegration:
 
     def test_retrieve_wires_to_gemini_retrieve_batch(self, tmp_path, monkeypatch):
         """noxaudit retrieve calls GeminiProvider.retrieve_batch and returns findings."""
-        monkeypatch.chdir(tmp_path)
         cfg = self._write_gemini_config(tmp_path)
 
         # Write a pending batch file
-        import json as _json
-
         pending = {
             "submitted_at": "2026-02-25T10:00:00",
             "focus": "security",
@@ -642,7 +567,7 @@ class TestGeminiBatchCLIIntegration:
         }
         noxaudit_dir = tmp_path / ".noxaudit"
         noxaudit_dir.mkdir(exist_ok=True)
-        (noxaudit_dir / "pending-batch.json").write_text(_json.dumps(pending))
+        (noxaudit_dir / "pending-batch.json").write_text(json.dumps(pending))
 
         finding = Finding(
             id="abc123def456",
@@ -669,29 +594,26 @@ class TestGeminiBatchCLIIntegration:
         }
         provider_cls = MagicMock(return_value=instance)
 
+        monkeypatch.setitem(runner_mod.PROVIDERS, "gemini", provider_cls)
+
         runner = CliRunner()
-        with (
-            patch.dict("noxaudit.runner.PROVIDERS", {"gemini": provider_cls}),
-            patch("noxaudit.runner.save_latest_findings"),
-        ):
-            result = runner.invoke(
-                main,
-                ["--config", cfg, "retrieve"],
-                catch_exceptions=False,
+        with patch("noxaudit.runner.save_latest_findings"):
+            assert_ok(
+                runner.invoke(
+                    main,
+                    ["--config", cfg, "retrieve"],
+                    catch_exceptions=False,
+                )
             )
 
-        assert result.exit_code == 0, result.output
         instance.retrieve_batch.assert_called_once_with(
             "batches/gemini-job-001", default_focus="security"
         )
 
     def test_retrieve_shows_still_processing_when_not_done(self, tmp_path, monkeypatch):
         """noxaudit retrieve reports still processing when batch not yet complete."""
-        monkeypatch.chdir(tmp_path)
         cfg = self._write_gemini_config(tmp_path)
 
-        import json as _json
-
         pending = {
             "submitted_at": "2026-02-25T10:00:00",
             "focus": "security",
@@ -707,7 +629,7 @@ class TestGeminiBatchCLIIntegration:
         }
         noxaudit_dir = tmp_path / ".noxaudit"
         noxaudit_dir.mkdir(exist_ok=True)
-        (noxaudit_dir / "pending-batch.json").write_text(_json.dumps(pending))
+        (noxaudit_dir / "pending-batch.json").write_text(json.dumps(pending))
 
         instance = MagicMock()
         instance.retrieve_batch.return_value = {
@@ -717,13 +639,15 @@ class TestGeminiBatchCLIIntegration:
         }
         provider_cls = MagicMock(return_value=instance)
 
+        monkeypatch.setitem(runner_mod.PROVIDERS, "gemini", provider_cls)
+
         runner = CliRunner()
-        with patch.dict("noxaudit.runner.PROVIDERS", {"gemini": provider_cls}):
-            result = runner.invoke(
+        result = assert_ok(
+            runner.invoke(
                 main,
                 ["--config", cfg, "retrieve"],
                 catch_exceptions=False,
             )
+        )
 
-        assert result.exit_code == 0, result.output
         assert "processing" in result.output.lower() or "No results ready" in result.output
@@ -2,16 +2,40 @@
 
 from __future__ import annotations
 
+import dataclasses
+import textwrap
 import warnings
 
+import pytest
+
 from noxaudit.config import (
     ALL_FOCUS_NAMES,
     NoxauditConfig,
     load_config,
+    load_config_from_dict,
     normalize_focus,
 )
 
 
+# Static YAML fixtures, dedented once at import time
+_REPOS_YAML = textwrap.dedent("""\
+    repos:
+      - name: my-app
+        path: .
+        exclude:
+          - vendor
+""")
+_SCHEDULE_YAML = textwrap.dedent("""\
+    schedule:
+      monday: security
+""")
+_PLAIN_REPO_YAML = textwrap.dedent("""\
+    repos:
+      - name: my-app
+        path: .
+""")
+
+
 class TestNormalizeFocus:
     def test_single_string(self):
         assert normalize_focus("security") == ["security"]
@@ -33,10 +57,25 @@ class TestNormalizeFocus:
             "docs",
         ]
 
+    def test_comma_separated_skips_empty_items(self):
+        assert normalize_focus(" security, ,docs, ") == ["security", "docs"]
+
+    def test_comma_separated_names_are_interned(self):
+        raw = ",".join(["security", "docs"])
+        result = normalize_focus(raw)
+        assert result[0] is ALL_FOCUS_NAMES[0]
+        assert result[1] is ALL_FOCUS_NAMES[1]
+
     def test_list_passthrough(self):
         names = ["security", "docs"]
         assert normalize_focus(names) == names
 
+    def test_tuple_passthrough(self):
+        assert normalize_focus(("security", "docs")) == ["security", "docs"]
+
+    def test_unknown_single_name_passes_through(self):
+        assert normalize_focus("bogus") == ["bogus"]
+
     def test_yaml_false_treated_as_off(self):
         # YAML parses bare `off` as False
         assert normalize_focus(False) == []
@@ -53,6 +92,11 @@ class TestNormalizeFocus:
         # YAML might parse `[on, off]` as `[True, False]`
         assert normalize_focus([True, False]) == ["True", "False"]
 
+    def test_cached_result_not_shared_between_calls(self):
+        first = normalize_focus("all")
+        first.append("bogus")
+        assert normalize_focus("all") == list(ALL_FOCUS_NAMES)
+
 
 class TestLoadConfig:
     def test_default_config_when_no_file(self, tmp_path):
@@ -60,25 +104,43 @@ class TestLoadConfig:
         assert isinstance(config, NoxauditConfig)
 
     def test_repos_loaded(self, tmp_config):
-        path = tmp_config("""\
-            repos:
-              - name: my-app
-                path: .
-                exclude:
-                  - vendor
-        """)
+        path = tmp_config(_REPOS_YAML)
         config = load_config(path)
         assert len(config.repos) == 1
         assert config.repos[0].name == "my-app"
         assert "vendor" in config.repos[0].exclude_patterns
 
+    def test_from_dict_matches_yaml_structure(self):
+        config = load_config_from_dict(
+            {"repos": [{"name": "my-app", "path": ".", "exclude": ["vendor"]}]}
+        )
+        assert len(config.repos) == 1
+        assert config.repos[0].name == "my-app"
+        assert "vendor" in config.repos[0].exclude_patterns
+
+    def test_reloads_after_file_changes(self, tmp_config):
+        path = tmp_config(_PLAIN_REPO_YAML)
+        assert load_config(path).repos[0].name == "my-app"
+
+        path.write_text(_PLAIN_REPO_YAML.replace("my-app", "renamed-app"))
+        assert load_config(path).repos[0].name == "renamed-app"
+
+    def test_config_is_frozen(self, tmp_config):
+        config = load_config(tmp_config(_PLAIN_REPO_YAML))
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            config.model = "other"
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            config.repos[0].path = "/elsewhere"
+
+    def test_mutating_loaded_config_does_not_leak(self, tmp_config):
+        path = tmp_config(_REPOS_YAML)
+        load_config(path).repos[0].exclude_patterns.append("build")
+        assert load_config(path).repos[0].exclude_patterns == ["vendor"]
+
 
 class TestDeprecationWarnings:
     def test_schedule_key_emits_warning(self, tmp_config):
-        path = tmp_config("""\
-            schedule:
-              monday: security
-        """)
+        path = tmp_config(_SCHEDULE_YAML)
         with warnings.catch_warnings(record=True) as w:
             warnings.simplefilter("always")
             load_config(path)
@@ -86,41 +148,30 @@ class TestDeprecationWarnings:
         assert len(deprecation_warnings) == 1
         assert "schedule" in str(deprecation_warnings[0].message)
 
-    def test_frames_key_emits_warning(self, tmp_config):
-        path = tmp_config("""\
-            frames:
-              does_it_last:
-                dependencies: false
-        """)
+    def test_frames_key_emits_warning(self):
         with warnings.catch_warnings(record=True) as w:
             warnings.simplefilter("always")
-            load_config(path)
+            load_config_from_dict({"frames": {"does_it_last": {"dependencies": False}}})
         deprecation_warnings = [x for x in w if issubclass(x.category, DeprecationWarning)]
         assert len(deprecation_warnings) == 1
         assert "frames" in str(deprecation_warnings[0].message)
 
-    def test_both_keys_emit_two_warnings(self, tmp_config):
-        path = tmp_config("""\
-            schedule:
-              monday: security
-            frames:
-              does_it_last:
-                dependencies: false
-        """)
+    def test_both_keys_emit_two_warnings(self):
         with warnings.catch_warnings(record=True) as w:
             warnings.simplefilter("always")
-            load_config(path)
+            load_config_from_dict({"schedule": {"monday": "security"}, "frames": {}})
         deprecation_warnings = [x for x in w if issubclass(x.category, DeprecationWarning)]
         assert len(deprecation_warnings) == 2
 
-    def test_no_warning_without_schedule_or_frames(self, tmp_config):
-        path = tmp_config("""\
-            repos:
-              - name: my-app
-                path: .
-        """)
+    def test_no_warning_without_schedule_or_frames(self):
         with warnings.catch_warnings(record=True) as w:
             warnings.simplefilter("always")
-            load_config(path)
+            load_config_from_dict({"repos": [{"name": "my-app", "path": "."}]})
         deprecation_warnings = [x for x in w if issubclass(x.category, DeprecationWarning)]
         assert len(deprecation_warnings) == 0
+
+    def test_warning_points_at_caller(self):
+        with warnings.catch_warnings(record=True) as w:
+            warnings.simplefilter("always")
+            load_config_from_dict({"schedule": {}})
+        assert w[0].filename == __file__
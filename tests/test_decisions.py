@@ -9,9 +9,13 @@ from noxaudit.decisions import (
     format_decision_context,
     load_decisions,
     save_decision,
+    save_decisions,
 )
 from noxaudit.models import Decision, DecisionType, Finding, Severity
 
+# Fixed clock for expiry checks, passed to filter_findings as `today`
+_TODAY = date(2026, 2, 16)
+
 
 def _make_finding(id: str = "abc123", file: str = "a.py") -> Finding:
     return Finding(
@@ -29,7 +33,7 @@ def _make_decision(
     decision: DecisionType = DecisionType.DISMISSED,
     days_ago: int = 10,
 ) -> Decision:
-    d = date.today() - timedelta(days=days_ago)
+    d = _TODAY - timedelta(days=days_ago)
     return Decision(
         finding_id=finding_id,
         decision=decision,
@@ -59,31 +63,68 @@ class TestLoadSaveDecisions:
         loaded = load_decisions(path)
         assert len(loaded) == 2
 
+    def test_save_decisions_appends_in_order(self, tmp_path):
+        path = tmp_path / "nested" / "decisions.jsonl"
+        save_decision(path, _make_decision("aaa"))
+        save_decisions(path, [_make_decision("bbb"), _make_decision("ccc")])
+        assert [d.finding_id for d in load_decisions(path)] == ["aaa", "bbb", "ccc"]
+
+    def test_save_decisions_empty_does_not_create_file(self, tmp_path):
+        path = tmp_path / "decisions.jsonl"
+        save_decisions(path, [])
+        assert not path.exists()
+
 
 class TestFilterFindings:
     def test_new_finding_passes(self, tmp_path):
         findings = [_make_finding("new1")]
-        new, resolved = filter_findings(findings, [], str(tmp_path))
+        new, resolved = filter_findings(findings, [], str(tmp_path), today=_TODAY)
         assert len(new) == 1
         assert resolved == 0
 
     def test_dismissed_finding_filtered(self, tmp_path):
         findings = [_make_finding("abc")]
         decisions = [_make_decision("abc", DecisionType.DISMISSED)]
-        new, resolved = filter_findings(findings, decisions, str(tmp_path))
+        new, resolved = filter_findings(findings, decisions, str(tmp_path), today=_TODAY)
         assert len(new) == 0
         assert resolved == 1
 
     def test_expired_decision_resurfaces(self, tmp_path):
         findings = [_make_finding("abc")]
         decisions = [_make_decision("abc", days_ago=100)]
-        new, resolved = filter_findings(findings, decisions, str(tmp_path), expiry_days=90)
+        new, resolved = filter_findings(
+            findings, decisions, str(tmp_path), expiry_days=90, today=_TODAY
+        )
         assert len(new) == 1
+        assert resolved == 0
+
+    def test_decision_at_expiry_boundary_still_valid(self, tmp_path):
+        findings = [_make_finding("abc")]
+        decisions = [_make_decision("abc", days_ago=90)]
+        new, resolved = filter_findings(
+            findings, decisions, str(tmp_path), expiry_days=90, today=_TODAY
+        )
+        assert new == []
+        assert resolved == 1
+
+    def test_malformed_date_on_unrelated_decision_is_ignored(self, tmp_path):
+        findings = [_make_finding("abc")]
+        unrelated = Decision(
+            finding_id="zzz",
+            decision=DecisionType.DISMISSED,
+            reason="test",
+            date="not-a-date",
+            by="user",
+        )
+        decisions = [_make_decision("abc"), unrelated]
+        new, resolved = filter_findings(findings, decisions, str(tmp_path), today=_TODAY)
+        assert new == []
+        assert resolved == 1
 
     def test_intentional_counts_as_resolved(self, tmp_path):
         findings = [_make_finding("abc")]
         decisions = [_make_decision("abc", DecisionType.INTENTIONAL)]
-        new, resolved = filter_findings(findings, decisions, str(tmp_path))
+        new, resolved = filter_findings(findings, decisions, str(tmp_path), today=_TODAY)
         assert len(new) == 0
         assert resolved == 1
 
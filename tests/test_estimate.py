@@ -2,17 +2,25 @@
 
 from __future__ import annotations
 
-import yaml
+import dataclasses
+
+import pytest
 from click.testing import CliRunner
 
 from noxaudit.cli import main
+from noxaudit.config import NoxauditConfig, RepoConfig
 from noxaudit.models import FileContent
 from noxaudit.pricing import (
     MODEL_PRICING,
+    compute_estimate_report,
     estimate_cost,
     estimate_output_tokens,
     estimate_prepass_reduction,
+    format_estimate_report,
+    resolve_model_key,
 )
+from noxaudit.runner import run_estimate
+from tests.helpers import dump_yaml
 
 
 # ---------------------------------------------------------------------------
@@ -66,6 +74,21 @@ class TestEstimateCost:
         expected = (200_000 / 1_000_000) * 3.0 + (1_000 / 1_000_000) * 15.0
         assert abs(cost - expected) < 0.001
 
+    def test_pricing_is_hashable_and_frozen(self):
+        pricing = MODEL_PRICING["gemini-2.5-flash"]
+        assert hash(pricing) == hash(MODEL_PRICING["gemini-2.5-flash"])
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            pricing.input_per_million = 0.0
+
+    def test_repeated_estimates_are_stable(self):
+        pricing = MODEL_PRICING["claude-sonnet-4-6"]
+        first = estimate_cost(123_456, 7_890, pricing, use_batch=True)
+        assert estimate_cost(123_456, 7_890, pricing, use_batch=True) == first
+        # An equal but distinct frozen pricing object prices identically
+        copy = dataclasses.replace(pricing)
+        assert copy is not pricing
+        assert estimate_cost(123_456, 7_890, copy, use_batch=True) == first
+
 
 # ---------------------------------------------------------------------------
 # estimate_output_tokens
@@ -91,6 +114,23 @@ class TestEstimateOutputTokens:
         assert tokens == 16_384 * 4
 
 
+# ---------------------------------------------------------------------------
+# resolve_model_key
+# ---------------------------------------------------------------------------
+
+
+class TestResolveModelKey:
+    def test_direct_key_passthrough(self):
+        assert resolve_model_key("gemini", "gemini-2.5-pro") == "gemini-2.5-pro"
+
+    def test_heuristic_fallback(self):
+        assert resolve_model_key("anthropic", "claude-opus-something") == "claude-opus-4-6"
+
+    def test_repeated_lookups_are_stable(self):
+        for _ in range(3):
+            assert resolve_model_key("anthropic", "some-haiku-model") == "claude-haiku-4-5"
+
+
 # ---------------------------------------------------------------------------
 # estimate_prepass_reduction
 # ---------------------------------------------------------------------------
@@ -98,7 +138,7 @@ class TestEstimateOutputTokens:
 
 def _make_files(sizes_chars: list[int]) -> list[FileContent]:
     return [
-        FileContent(path=f"file{i}.py", content="x" * size) for i, size in enumerate(sizes_chars)
+        FileContent(path=f"file{i}.py", content="", size=size) for i, size in enumerate(sizes_chars)
     ]
 
 
@@ -124,7 +164,7 @@ class TestEstimatePrepassReduction:
     def test_token_reduction_smaller_than_total(self):
         # Small files first (high/medium priority), large files last (low/skip)
         files = _make_files([400] * 10 + [40_000] * 10)  # 20 files
-        total_tokens = sum(len(f.content) // 4 for f in files)
+        total_tokens = sum(f.size // 4 for f in files)
         result = estimate_prepass_reduction(files, total_tokens)
         assert result["reduced_tokens"] < total_tokens
 
@@ -153,65 +193,74 @@ def _write_config(tmp_path, model="gemini-2.5-flash", provider="gemini"):
         "model": model,
     }
     cfg_path = tmp_path / "noxaudit.yml"
-    cfg_path.write_text(yaml.dump(config))
+    cfg_path.write_text(dump_yaml(config))
     return str(cfg_path)
 
 
-class TestEstimateCLI:
-    def test_basic_output_gemini(self, tmp_path):
-        (tmp_path / "app.py").write_text("x = 1\n" * 100)
-        cfg = _write_config(tmp_path, model="gemini-2.5-flash", provider="gemini")
-        runner = CliRunner()
-        result = runner.invoke(main, ["--config", cfg, "estimate", "--focus", "security"])
-        assert result.exit_code == 0, result.output
-        assert "Cost estimate" in result.output
-        assert "test-repo" in result.output
-        assert "gemini" in result.output
+class TestComputeEstimateReport:
+    def test_basic_fields(self):
+        files = _make_files([4_000] * 5)
+        report = compute_estimate_report("r", ["security"], files, "gemini", "gemini-2.5-flash")
+        assert report.file_count == 5
+        assert report.input_tokens == 5_000
+        assert report.use_batch is True
+        assert report.tiered is False
+        assert report.monthly_cost == report.cost * 30
+
+    def test_alternatives_cheaper_and_sorted(self):
+        files = _make_files([4_000] * 50)
+        report = compute_estimate_report("r", ["security"], files, "anthropic", "claude-opus-4-6")
+        costs = [alt.cost for alt in report.alternatives]
+        assert costs
+        assert costs == sorted(costs)
+        assert all(alt.cost < report.cost for alt in report.alternatives)
+        assert "claude-opus-4-6" not in {alt.model_key for alt in report.alternatives}
+
+    def test_cheapest_model_has_no_alternatives(self):
+        report = compute_estimate_report(
+            "r", ["security"], _make_files([4_000]), "openai", "gpt-5-nano"
+        )
+        assert report.alternatives == []
+
+    def test_prepass_offered_for_tiered_anthropic(self):
+        files = _make_files([40_000] * 30)  # 300K tokens, over the 200K tier
+        report = compute_estimate_report("r", ["security"], files, "anthropic", "claude-sonnet-4-6")
+        assert report.tiered is True
+        assert report.prepass is not None
+        assert report.prepass_cost < report.cost
+
+    def test_formatter_renders_report(self):
+        files = _make_files([40_000] * 30)
+        report = compute_estimate_report(
+            "my-repo", ["security"], files, "anthropic", "claude-sonnet-4-6"
+        )
+        text = format_estimate_report(report)
+        assert "my-repo — security" in text
+        assert "! Cost estimate" in text
+        assert "Alternatives:" in text
+        assert "Pre-pass estimate:" in text
+        assert "assuming daily runs" in text
 
+
+def _config(repo_path, model="gemini-2.5-flash", provider="gemini") -> NoxauditConfig:
+    return NoxauditConfig(
+        repos=[RepoConfig(name="test-repo", path=str(repo_path), provider_rotation=[provider])],
+        model=model,
+    )
+
+
+class TestRunEstimate:
     def test_shows_files_and_tokens(self, tmp_path):
         (tmp_path / "app.py").write_text("x = 1\n" * 200)
-        cfg = _write_config(tmp_path, model="gemini-2.5-flash", provider="gemini")
-        runner = CliRunner()
-        result = runner.invoke(main, ["--config", cfg, "estimate", "--focus", "security"])
-        assert result.exit_code == 0, result.output
-        assert "files" in result.output
-        assert "tokens" in result.output
-
-    def test_shows_alternatives_for_expensive_provider(self, tmp_path):
-        (tmp_path / "app.py").write_text("x = 1\n" * 1_000)
-        cfg = _write_config(tmp_path, model="claude-opus-4-6", provider="anthropic")
-        runner = CliRunner()
-        result = runner.invoke(main, ["--config", cfg, "estimate", "--focus", "security"])
-        assert result.exit_code == 0, result.output
-        assert "Alternatives" in result.output
+        output = run_estimate(_config(tmp_path), focus_name="security")
+        assert "files" in output
+        assert "tokens" in output
 
     def test_no_files_graceful(self, tmp_path):
-        """Empty repo directory (no matching files) should print 'No files found'."""
-        repo_dir = tmp_path / "myrepo"
-        repo_dir.mkdir()
+        """Empty repo directory (no matching files) should report 'No files found'."""
         # Write only a file that security focus won't match (e.g. .png)
-        (repo_dir / "image.png").write_bytes(b"\x89PNG")
-        cfg_path = tmp_path / "noxaudit.yml"
-        import yaml
-
-        cfg_path.write_text(
-            yaml.dump(
-                {
-                    "repos": [
-                        {
-                            "name": "test-repo",
-                            "path": str(repo_dir),
-                            "provider_rotation": ["gemini"],
-                        }
-                    ],
-                    "model": "gemini-2.5-flash",
-                }
-            )
-        )
-        runner = CliRunner()
-        result = runner.invoke(main, ["--config", str(cfg_path), "estimate", "--focus", "security"])
-        assert result.exit_code == 0, result.output
-        assert "No files found" in result.output
+        (tmp_path / "image.png").write_bytes(b"\x89PNG")
+        assert "No files found" in run_estimate(_config(tmp_path), focus_name="security")
 
     def test_no_api_keys_needed(self, tmp_path, monkeypatch):
         """Estimate should work even with no API key env vars set."""
@@ -219,35 +268,44 @@ class TestEstimateCLI:
         monkeypatch.delenv("ANTHROPIC_API_KEY", raising=False)
         monkeypatch.delenv("GOOGLE_API_KEY", raising=False)
         monkeypatch.delenv("GEMINI_API_KEY", raising=False)
-        cfg = _write_config(tmp_path, model="gemini-2.5-flash", provider="gemini")
-        runner = CliRunner()
-        result = runner.invoke(main, ["--config", cfg, "estimate", "--focus", "security"])
-        assert result.exit_code == 0, result.output
-        assert "Cost estimate" in result.output
+        assert "Cost estimate" in run_estimate(_config(tmp_path), focus_name="security")
+
+    def test_no_repos_configured(self):
+        assert "No repos configured" in run_estimate(NoxauditConfig(), focus_name="security")
+
+    def test_focus_off_returns_empty(self, tmp_path):
+        assert run_estimate(_config(tmp_path), focus_name="off") == ""
+
+    def test_unknown_repo_raises(self, tmp_path):
+        with pytest.raises(ValueError, match="Unknown repo: nope"):
+            run_estimate(_config(tmp_path), repo_name="nope", focus_name="security")
+
 
-    def test_monthly_projection_shown(self, tmp_path):
+class TestEstimateCLI:
+    def test_basic_output_gemini(self, tmp_path):
         (tmp_path / "app.py").write_text("x = 1\n" * 100)
-        cfg = _write_config(tmp_path)
+        cfg = _write_config(tmp_path, model="gemini-2.5-flash", provider="gemini")
         runner = CliRunner()
         result = runner.invoke(main, ["--config", cfg, "estimate", "--focus", "security"])
         assert result.exit_code == 0, result.output
-        assert "assuming daily runs" in result.output
-
-    def test_no_repos_configured(self, tmp_path):
-        cfg_path = tmp_path / "noxaudit.yml"
-        cfg_path.write_text(yaml.dump({}))
-        runner = CliRunner()
-        result = runner.invoke(main, ["--config", str(cfg_path), "estimate", "--focus", "security"])
-        assert result.exit_code == 0, result.output
-        assert "No repos configured" in result.output
+        assert "Cost estimate" in result.output
+        assert "test-repo" in result.output
+        assert "gemini" in result.output
 
     def test_provider_override(self, tmp_path):
         """--provider flag overrides config provider."""
         (tmp_path / "app.py").write_text("x = 1\n" * 100)
-        cfg = _write_config(tmp_path, model="gemini-2.5-flash", provider="gemini")
+        cfg = _write_config(tmp_path, model="gemini-2.5-flash", provider="anthropic")
         runner = CliRunner()
         result = runner.invoke(
             main, ["--config", cfg, "estimate", "--focus", "security", "--provider", "gemini"]
         )
         assert result.exit_code == 0, result.output
-        assert "gemini" in result.output
+        assert "Provider:  gemini (gemini-2.5-flash)" in result.output
+
+    def test_unknown_repo_errors(self, tmp_path):
+        cfg = _write_config(tmp_path)
+        runner = CliRunner()
+        result = runner.invoke(main, ["--config", cfg, "estimate", "--repo", "nope"])
+        assert result.exit_code != 0
+        assert "Unknown repo: nope" in result.output
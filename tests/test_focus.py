@@ -2,6 +2,9 @@
 
 from __future__ import annotations
 
+import pytest
+
+from noxaudit.config import ALL_FOCUS_NAMES
 from noxaudit.focus import FOCUS_AREAS
 from noxaudit.focus.base import (
     BaseFocus,
@@ -32,20 +35,23 @@ class StubFocusB(BaseFocus):
         return "Check for beta issues."
 
 
+@pytest.fixture(scope="module")
+def alpha_paths(tmp_repo_ro):
+    """Paths gathered for StubFocusA from the shared read-only repo, walked once."""
+    return {f.path for f in gather_files_combined([StubFocusA()], tmp_repo_ro)}
+
+
 class TestGatherFilesCombined:
-    def test_single_focus(self, tmp_repo):
-        focus = StubFocusA()
-        files = gather_files_combined([focus], tmp_repo)
-        paths = {f.path for f in files}
-        assert "src/app.py" in paths
-        assert "config.yml" in paths
+    def test_single_focus(self, alpha_paths):
+        assert "src/app.py" in alpha_paths
+        assert "config.yml" in alpha_paths
 
-    def test_deduplicates_across_focus_areas(self, tmp_repo):
+    def test_deduplicates_across_focus_areas(self, tmp_repo_ro):
         a = StubFocusA()
         b = StubFocusB()
-        combined = gather_files_combined([a, b], tmp_repo)
-        separate_a = gather_files_combined([a], tmp_repo)
-        separate_b = gather_files_combined([b], tmp_repo)
+        combined = gather_files_combined([a, b], tmp_repo_ro)
+        separate_a = gather_files_combined([a], tmp_repo_ro)
+        separate_b = gather_files_combined([b], tmp_repo_ro)
 
         combined_paths = [f.path for f in combined]
         # No duplicates
@@ -56,17 +62,11 @@ class TestGatherFilesCombined:
         all_paths = {f.path for f in separate_a} | {f.path for f in separate_b}
         assert set(combined_paths) == all_paths
 
-    def test_excludes_node_modules(self, tmp_repo):
-        focus = StubFocusA()
-        files = gather_files_combined([focus], tmp_repo)
-        paths = {f.path for f in files}
-        assert not any("node_modules" in p for p in paths)
+    def test_excludes_node_modules(self, alpha_paths):
+        assert not any("node_modules" in p for p in alpha_paths)
 
-    def test_excludes_git(self, tmp_repo):
-        focus = StubFocusA()
-        files = gather_files_combined([focus], tmp_repo)
-        paths = {f.path for f in files}
-        assert not any(".git" in p for p in paths)
+    def test_excludes_git(self, alpha_paths):
+        assert not any(".git" in p for p in alpha_paths)
 
     def test_excludes_custom_patterns(self, tmp_repo):
         (tmp_repo / "vendor").mkdir()
@@ -84,16 +84,24 @@ class TestGatherFilesCombined:
         paths = {f.path for f in files}
         assert "big.py" not in paths
 
+    def test_without_content_reports_sizes(self, tmp_repo_ro):
+        focus = StubFocusA()
+        with_content = gather_files_combined([focus], tmp_repo_ro)
+        sized = gather_files_combined([focus], tmp_repo_ro, with_content=False)
+        assert [f.path for f in sized] == [f.path for f in with_content]
+        assert all(f.content == "" for f in sized)
+        assert [f.size for f in sized] == [f.size for f in with_content]
+
     def test_empty_repo(self, tmp_path):
         focus = StubFocusA()
         files = gather_files_combined([focus], tmp_path)
         assert files == []
 
-    def test_with_real_focus_areas(self, tmp_repo):
+    def test_with_real_focus_areas(self, tmp_repo_ro):
         """Test with actual SecurityFocus + DocsFocus to ensure no errors."""
         sec = FOCUS_AREAS["security"]()
         docs = FOCUS_AREAS["docs"]()
-        combined = gather_files_combined([sec, docs], tmp_repo)
+        combined = gather_files_combined([sec, docs], tmp_repo_ro)
         assert len(combined) > 0
         paths = [f.path for f in combined]
         assert len(paths) == len(set(paths))
@@ -127,3 +135,15 @@ class TestBuildCombinedPrompt:
         assert "## Focus Area: security" in prompt
         assert "## Focus Area: performance" in prompt
         assert "## Focus Area: docs" in prompt
+
+
+class TestFocusRegistry:
+    @pytest.mark.parametrize("name", ALL_FOCUS_NAMES)
+    def test_focus_name_is_registered(self, name):
+        focus = FOCUS_AREAS[name]()
+        assert focus.name == name
+        assert focus.get_file_patterns()
+        assert focus.get_prompt()
+
+    def test_registry_matches_focus_names(self):
+        assert set(FOCUS_AREAS) == set(ALL_FOCUS_NAMES)
@@ -4,7 +4,7 @@ from __future__ import annotations
 
 import asyncio
 import json
-import os
+from types import SimpleNamespace
 from unittest.mock import patch
 
 import pytest
@@ -19,7 +19,7 @@ from noxaudit.mcp.state import save_latest_findings
 from noxaudit.models import Finding, Severity
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def findings():
     return [
         Finding(
@@ -53,101 +53,120 @@ def findings():
     ]
 
 
-@pytest.fixture
-def mcp_state(tmp_path, findings):
-    """Set up MCP state in a temp dir and chdir there."""
+@pytest.fixture(scope="module")
+def run():
+    """Run coroutines on one event loop shared by the module, not a new loop per call."""
+    loop = asyncio.new_event_loop()
+    yield loop.run_until_complete
+    loop.close()
+
+
+def _save_state(findings, base_path):
     save_latest_findings(
         findings,
         repo="my-app",
         focus="security+docs",
         timestamp="2026-02-18T10:00:00",
         resolved_count=2,
-        base_path=tmp_path,
+        base_path=base_path,
     )
-    original_dir = os.getcwd()
-    os.chdir(tmp_path)
-    yield tmp_path
-    os.chdir(original_dir)
+
+
+@pytest.fixture(scope="module")
+def saved_state(tmp_path_factory, findings):
+    """MCP state written once per module, shared by tests that only read it."""
+    base_path = tmp_path_factory.mktemp("mcp_state")
+    _save_state(findings, base_path)
+    return base_path
+
+
+@pytest.fixture
+def mcp_state_ro(saved_state, monkeypatch):
+    """Chdir into the shared read-only MCP state."""
+    monkeypatch.chdir(saved_state)
+    return saved_state
+
+
+@pytest.fixture
+def mcp_state(isolated_cwd, findings):
+    """Set up fresh MCP state in a temp dir and chdir there, for tests that write."""
+    _save_state(findings, isolated_cwd)
+    return isolated_cwd
 
 
 class TestGetFindings:
-    def test_returns_all_findings(self, mcp_state):
-        result = asyncio.run(get_findings())
+    def test_returns_all_findings(self, run, mcp_state_ro):
+        result = run(get_findings())
         assert "3 finding(s)" in result
         assert "SQL injection" in result
         assert "Missing rate limit" in result
         assert "Stale install instructions" in result
 
-    def test_filter_by_file(self, mcp_state):
-        result = asyncio.run(get_findings(file="auth.py"))
+    def test_filter_by_file(self, run, mcp_state_ro):
+        result = run(get_findings(file="auth.py"))
         assert "1 finding(s)" in result
         assert "SQL injection" in result
         assert "Missing rate limit" not in result
 
-    def test_filter_by_severity(self, mcp_state):
-        result = asyncio.run(get_findings(severity="high"))
+    def test_filter_by_severity(self, run, mcp_state_ro):
+        result = run(get_findings(severity="high"))
         assert "1 finding(s)" in result
         assert "SQL injection" in result
 
-    def test_filter_by_focus(self, mcp_state):
-        result = asyncio.run(get_findings(focus="docs"))
+    def test_filter_by_focus(self, run, mcp_state_ro):
+        result = run(get_findings(focus="docs"))
         assert "1 finding(s)" in result
         assert "Stale install instructions" in result
 
-    def test_limit(self, mcp_state):
-        result = asyncio.run(get_findings(limit=1))
+    def test_limit(self, run, mcp_state_ro):
+        result = run(get_findings(limit=1))
         assert "1 finding(s)" in result
 
-    def test_no_matches(self, mcp_state):
-        result = asyncio.run(get_findings(file="nonexistent.py"))
+    def test_no_matches(self, run, mcp_state_ro):
+        result = run(get_findings(file="nonexistent.py"))
         assert "No findings" in result
 
-    def test_no_findings_file(self, tmp_path):
-        original_dir = os.getcwd()
-        os.chdir(tmp_path)
-        try:
-            result = asyncio.run(get_findings())
-            assert "No findings" in result
-        finally:
-            os.chdir(original_dir)
+    def test_no_findings_file(self, run, isolated_cwd):
+        result = run(get_findings())
+        assert "No findings" in result
 
 
 class TestGetHealthSummary:
-    def test_returns_score(self, mcp_state):
-        result = asyncio.run(get_health_summary())
+    def test_returns_score(self, run, mcp_state_ro):
+        result = run(get_health_summary())
         # score = 100 - 1*15 - 1*5 - 1*1 = 79
         assert "Health Score: 79/100" in result
 
-    def test_severity_counts(self, mcp_state):
-        result = asyncio.run(get_health_summary())
+    def test_severity_counts(self, run, mcp_state_ro):
+        result = run(get_health_summary())
         assert "High:   1" in result
         assert "Medium: 1" in result
         assert "Low:    1" in result
         assert "Total:  3" in result
 
-    def test_worst_files(self, mcp_state):
-        result = asyncio.run(get_health_summary())
+    def test_worst_files(self, run, mcp_state_ro):
+        result = run(get_health_summary())
         assert "src/auth.py" in result
         assert "src/api.ts" in result
 
-    def test_focus_areas(self, mcp_state):
-        result = asyncio.run(get_health_summary())
+    def test_focus_areas(self, run, mcp_state_ro):
+        result = run(get_health_summary())
         assert "docs" in result
         assert "security" in result
 
-    def test_resolved_count(self, mcp_state):
-        result = asyncio.run(get_health_summary())
+    def test_resolved_count(self, run, mcp_state_ro):
+        result = run(get_health_summary())
         assert "Resolved count: 2" in result
 
-    def test_timestamp(self, mcp_state):
-        result = asyncio.run(get_health_summary())
+    def test_timestamp(self, run, mcp_state_ro):
+        result = run(get_health_summary())
         assert "2026-02-18T10:00:00" in result
 
-    def test_repo(self, mcp_state):
-        result = asyncio.run(get_health_summary())
+    def test_repo(self, run, mcp_state_ro):
+        result = run(get_health_summary())
         assert "my-app" in result
 
-    def test_score_clamped_at_zero(self, tmp_path):
+    def test_score_clamped_at_zero(self, run, isolated_cwd):
         """Score can't go below 0 with many findings."""
         many_findings = [
             Finding(
@@ -160,57 +179,59 @@ class TestGetHealthSummary:
             )
             for i in range(10)
         ]
-        save_latest_findings(many_findings, repo="r", focus="f", timestamp="t", base_path=tmp_path)
-        original_dir = os.getcwd()
-        os.chdir(tmp_path)
-        try:
-            result = asyncio.run(get_health_summary())
-            assert "Health Score: 0/100" in result
-        finally:
-            os.chdir(original_dir)
+        save_latest_findings(
+            many_findings, repo="r", focus="f", timestamp="t", base_path=isolated_cwd
+        )
+        result = run(get_health_summary())
+        assert "Health Score: 0/100" in result
+
+
+def _git_output(stdout: str = "") -> SimpleNamespace:
+    """Stand-in for a subprocess.run result; callers only read .stdout."""
+    return SimpleNamespace(stdout=stdout)
 
 
 class TestGetFindingsForDiff:
-    def test_matching_files(self, mcp_state):
-        mock_unstaged = type("R", (), {"stdout": "src/auth.py\n"})()
-        mock_staged = type("R", (), {"stdout": ""})()
+    def test_matching_files(self, run, mcp_state_ro):
+        mock_unstaged = _git_output("src/auth.py\n")
+        mock_staged = _git_output("")
         with patch("noxaudit.mcp.server.subprocess.run", side_effect=[mock_unstaged, mock_staged]):
-            result = asyncio.run(get_findings_for_diff())
+            result = run(get_findings_for_diff())
         assert "1 finding(s)" in result
         assert "SQL injection" in result
 
-    def test_no_changes(self, mcp_state):
-        mock_empty = type("R", (), {"stdout": ""})()
+    def test_no_changes(self, run, mcp_state_ro):
+        mock_empty = _git_output("")
         with patch("noxaudit.mcp.server.subprocess.run", side_effect=[mock_empty, mock_empty]):
-            result = asyncio.run(get_findings_for_diff())
+            result = run(get_findings_for_diff())
         assert "No uncommitted changes" in result
 
-    def test_clean_files_listed(self, mcp_state):
-        mock_unstaged = type("R", (), {"stdout": "src/auth.py\nclean_file.py\n"})()
-        mock_staged = type("R", (), {"stdout": ""})()
+    def test_clean_files_listed(self, run, mcp_state_ro):
+        mock_unstaged = _git_output("src/auth.py\nclean_file.py\n")
+        mock_staged = _git_output("")
         with patch("noxaudit.mcp.server.subprocess.run", side_effect=[mock_unstaged, mock_staged]):
-            result = asyncio.run(get_findings_for_diff())
+            result = run(get_findings_for_diff())
         assert "clean_file.py" in result
         assert "Clean changed files" in result
 
-    def test_no_findings_for_changed_files(self, mcp_state):
-        mock_unstaged = type("R", (), {"stdout": "clean_only.py\n"})()
-        mock_staged = type("R", (), {"stdout": ""})()
+    def test_no_findings_for_changed_files(self, run, mcp_state_ro):
+        mock_unstaged = _git_output("clean_only.py\n")
+        mock_staged = _git_output("")
         with patch("noxaudit.mcp.server.subprocess.run", side_effect=[mock_unstaged, mock_staged]):
-            result = asyncio.run(get_findings_for_diff())
+            result = run(get_findings_for_diff())
         assert "No findings in changed files" in result
 
-    def test_staged_changes_included(self, mcp_state):
-        mock_unstaged = type("R", (), {"stdout": ""})()
-        mock_staged = type("R", (), {"stdout": "src/api.ts\n"})()
+    def test_staged_changes_included(self, run, mcp_state_ro):
+        mock_unstaged = _git_output("")
+        mock_staged = _git_output("src/api.ts\n")
         with patch("noxaudit.mcp.server.subprocess.run", side_effect=[mock_unstaged, mock_staged]):
-            result = asyncio.run(get_findings_for_diff())
+            result = run(get_findings_for_diff())
         assert "Missing rate limit" in result
 
 
 class TestRecordDecision:
-    def test_valid_decision(self, mcp_state):
-        result = asyncio.run(
+    def test_valid_decision(self, run, mcp_state):
+        result = run(
             record_decision(
                 finding_id="aaa111",
                 action="dismiss",
@@ -227,8 +248,8 @@ class TestRecordDecision:
         assert data["finding_id"] == "aaa111"
         assert data["decision"] == "dismissed"
 
-    def test_invalid_action(self, mcp_state):
-        result = asyncio.run(
+    def test_invalid_action(self, run, mcp_state):
+        result = run(
             record_decision(
                 finding_id="aaa111",
                 action="invalid",
@@ -237,8 +258,8 @@ class TestRecordDecision:
         )
         assert "Invalid action" in result
 
-    def test_unknown_finding(self, mcp_state):
-        result = asyncio.run(
+    def test_unknown_finding(self, run, mcp_state):
+        result = run(
             record_decision(
                 finding_id="zzz999",
                 action="dismiss",
@@ -247,8 +268,8 @@ class TestRecordDecision:
         )
         assert "not found" in result
 
-    def test_accept_action(self, mcp_state):
-        result = asyncio.run(
+    def test_accept_action(self, run, mcp_state):
+        result = run(
             record_decision(
                 finding_id="bbb222",
                 action="accept",
@@ -258,8 +279,8 @@ class TestRecordDecision:
         assert "Decision recorded" in result
         assert "accept" in result
 
-    def test_intentional_action(self, mcp_state):
-        result = asyncio.run(
+    def test_intentional_action(self, run, mcp_state):
+        result = run(
             record_decision(
                 finding_id="ccc333",
                 action="intentional",
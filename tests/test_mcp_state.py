@@ -17,7 +17,7 @@ from noxaudit.mcp.state import (
 from noxaudit.models import Finding, Severity
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def findings():
     return [
         Finding(
@@ -42,6 +42,21 @@ def findings():
     ]
 
 
+@pytest.fixture(scope="module")
+def saved_state(tmp_path_factory, findings):
+    """latest-findings.json written once per module, shared by tests that only read it."""
+    base_path = tmp_path_factory.mktemp("mcp_state")
+    save_latest_findings(
+        findings,
+        repo="my-app",
+        focus="security+docs",
+        timestamp="2026-02-18T10:00:00",
+        resolved_count=3,
+        base_path=base_path,
+    )
+    return base_path
+
+
 class TestSaveLatestFindings:
     def test_creates_file(self, tmp_path, findings):
         path = save_latest_findings(
@@ -145,15 +160,8 @@ class TestLoadLatestFindings:
     def test_empty_when_no_file(self, tmp_path):
         assert load_latest_findings(tmp_path) == []
 
-    def test_roundtrip(self, tmp_path, findings):
-        save_latest_findings(
-            findings,
-            repo="my-app",
-            focus="security",
-            timestamp="2026-02-18T10:00:00",
-            base_path=tmp_path,
-        )
-        loaded = load_latest_findings(tmp_path)
+    def test_roundtrip(self, saved_state):
+        loaded = load_latest_findings(saved_state)
         assert len(loaded) == 2
         assert loaded[0].id == "aaa111"
         assert loaded[0].severity == Severity.HIGH
@@ -188,16 +196,8 @@ class TestLoadLatestMetadata:
     def test_empty_when_no_file(self, tmp_path):
         assert load_latest_metadata(tmp_path) == {}
 
-    def test_returns_metadata(self, tmp_path, findings):
-        save_latest_findings(
-            findings,
-            repo="my-app",
-            focus="security+docs",
-            timestamp="2026-02-18T10:00:00",
-            resolved_count=3,
-            base_path=tmp_path,
-        )
-        meta = load_latest_metadata(tmp_path)
+    def test_returns_metadata(self, saved_state):
+        meta = load_latest_metadata(saved_state)
         assert meta["repo"] == "my-app"
         assert meta["focus"] == "security+docs"
         assert meta["timestamp"] == "2026-02-18T10:00:00"
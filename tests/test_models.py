@@ -2,7 +2,22 @@
 
 from __future__ import annotations
 
-from noxaudit.models import AuditResult, Decision, DecisionType, Finding, Severity
+from noxaudit.models import (
+    AuditResult,
+    Decision,
+    DecisionType,
+    FileContent,
+    Finding,
+    Severity,
+)
+
+
+class TestFileContent:
+    def test_size_defaults_to_content_length(self):
+        assert FileContent(path="a.py", content="abcd").size == 4
+
+    def test_explicit_size_kept_without_content(self):
+        assert FileContent(path="a.py", content="", size=40_000).size == 40_000
 
 
 class TestFinding:
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import json
+from types import SimpleNamespace
 from unittest.mock import MagicMock
 
 import pytest
@@ -11,6 +12,12 @@ from noxaudit.models import Severity
 from noxaudit.providers.openai import FINDING_SCHEMA, OpenAIProvider
 
 
+@pytest.fixture(scope="module")
+def provider():
+    """Client-less provider shared by the stateless parsing tests."""
+    return OpenAIProvider.__new__(OpenAIProvider)
+
+
 class TestFindingSchema:
     def test_has_focus_field(self):
         props = FINDING_SCHEMA["properties"]["findings"]["items"]["properties"]
@@ -22,50 +29,7 @@ class TestFindingSchema:
         assert "focus" not in required
 
 
-class TestMakeFindingId:
-    @pytest.fixture
-    def provider(self):
-        p = OpenAIProvider.__new__(OpenAIProvider)
-        return p
-
-    def test_stable_hash(self, provider):
-        raw = {"file": "src/app.py", "title": "SQL injection", "line": 42}
-        id1 = provider._make_finding_id(raw)
-        id2 = provider._make_finding_id(raw)
-        assert id1 == id2
-        assert len(id1) == 12
-
-    def test_different_inputs_different_ids(self, provider):
-        a = {"file": "a.py", "title": "Bug A", "line": 1}
-        b = {"file": "b.py", "title": "Bug B", "line": 2}
-        assert provider._make_finding_id(a) != provider._make_finding_id(b)
-
-    def test_focus_changes_id(self, provider):
-        base = {"file": "a.py", "title": "Bug", "line": 1}
-        with_focus = {"file": "a.py", "title": "Bug", "line": 1, "focus": "security"}
-        assert provider._make_finding_id(base) != provider._make_finding_id(with_focus)
-
-    def test_no_line_still_works(self, provider):
-        raw = {"file": "a.py", "title": "Bug"}
-        fid = provider._make_finding_id(raw)
-        assert len(fid) == 12
-
-    def test_matches_anthropic_id_logic(self, provider):
-        """Finding IDs should use the same SHA-256 logic as Anthropic provider."""
-        import hashlib
-
-        raw = {"file": "src/main.py", "title": "SQL injection", "line": 10}
-        expected_key = "src/main.py:SQL injection:10"
-        expected_id = hashlib.sha256(expected_key.encode()).hexdigest()[:12]
-        assert provider._make_finding_id(raw) == expected_id
-
-
 class TestParseText:
-    @pytest.fixture
-    def provider(self):
-        p = OpenAIProvider.__new__(OpenAIProvider)
-        return p
-
     def test_basic_parsing(self, provider):
         text = json.dumps(
             {
@@ -86,58 +50,30 @@ class TestParseText:
         assert findings[0].file == "a.py"
         assert findings[0].focus is None
 
-    def test_focus_extracted(self, provider):
-        text = json.dumps(
-            {
-                "findings": [
-                    {
-                        "severity": "medium",
-                        "file": "b.py",
-                        "line": 5,
-                        "title": "Issue",
-                        "description": "An issue",
-                        "focus": "security",
-                    }
-                ]
-            }
-        )
-        findings = provider._parse_text(text)
-        assert findings[0].focus == "security"
-
-    def test_default_focus_backfill(self, provider):
-        text = json.dumps(
-            {
-                "findings": [
-                    {
-                        "severity": "low",
-                        "file": "c.py",
-                        "line": None,
-                        "title": "Hint",
-                        "description": "A hint",
-                    }
-                ]
-            }
-        )
-        findings = provider._parse_text(text, default_focus="docs")
-        assert findings[0].focus == "docs"
-
-    def test_explicit_focus_overrides_default(self, provider):
-        text = json.dumps(
-            {
-                "findings": [
-                    {
-                        "severity": "low",
-                        "file": "c.py",
-                        "line": None,
-                        "title": "Hint",
-                        "description": "A hint",
-                        "focus": "security",
-                    }
-                ]
-            }
+    @pytest.mark.parametrize(
+        ("focus", "default_focus", "expected"),
+        [
+            (None, None, None),
+            ("security", None, "security"),
+            (None, "docs", "docs"),
+            ("security", "docs", "security"),
+        ],
+        ids=["none", "explicit", "backfilled", "explicit-overrides-default"],
+    )
+    def test_focus_resolution(self, provider, focus, default_focus, expected):
+        raw = {
+            "severity": "low",
+            "file": "c.py",
+            "line": None,
+            "title": "Hint",
+            "description": "A hint",
+        }
+        if focus is not None:
+            raw["focus"] = focus
+        findings = provider._parse_text(
+            json.dumps({"findings": [raw]}), default_focus=default_focus
         )
-        findings = provider._parse_text(text, default_focus="docs")
-        assert findings[0].focus == "security"
+        assert findings[0].focus == expected
 
     def test_markdown_code_block(self, provider):
         text = '```json\n{"findings": [{"severity": "high", "file": "x.py", "title": "T", "description": "D"}]}\n```'
@@ -195,6 +131,7 @@ class TestSubmitBatch:
         assert provider.client.files.create.called
         call_kwargs = provider.client.files.create.call_args[1]
         assert call_kwargs["purpose"] == "batch"
+        assert call_kwargs["file"].getvalue() == provider._build_batch_jsonl(files, "prompt", "ctx")
 
         assert provider.client.batches.create.called
         batch_kwargs = provider.client.batches.create.call_args[1]
@@ -203,22 +140,13 @@ class TestSubmitBatch:
         assert batch_kwargs["completion_window"] == "24h"
 
     def test_jsonl_has_correct_structure(self, provider):
-
         from noxaudit.models import FileContent
 
         files = [FileContent(path="a.py", content="x = 1")]
-        provider.submit_batch(files, "sys", "ctx", custom_id="my-audit")
-
-        file_create_kwargs = provider.client.files.create.call_args[1]
-        file_data = file_create_kwargs["file"]
-        if hasattr(file_data, "read"):
-            jsonl_text = file_data.read().decode("utf-8")
-        else:
-            jsonl_text = (
-                file_data.decode("utf-8") if isinstance(file_data, bytes) else str(file_data)
-            )
-
-        entry = json.loads(jsonl_text.strip())
+        jsonl = provider._build_batch_jsonl(files, "sys", "ctx", custom_id="my-audit")
+
+        assert jsonl.endswith(b"\n")
+        entry = json.loads(jsonl)
         assert entry["custom_id"] == "my-audit"
         assert entry["method"] == "POST"
         assert entry["url"] == "/v1/chat/completions"
@@ -229,18 +157,7 @@ class TestSubmitBatch:
         from noxaudit.models import FileContent
 
         files = [FileContent(path="a.py", content="x = 1")]
-        provider.submit_batch(files, "prompt", "", num_focus_areas=3)
-
-        file_create_kwargs = provider.client.files.create.call_args[1]
-        file_data = file_create_kwargs["file"]
-        if hasattr(file_data, "read"):
-            jsonl_text = file_data.read().decode("utf-8")
-        else:
-            jsonl_text = (
-                file_data.decode("utf-8") if isinstance(file_data, bytes) else str(file_data)
-            )
-
-        entry = json.loads(jsonl_text.strip())
+        entry = json.loads(provider._build_batch_jsonl(files, "prompt", "", num_focus_areas=3))
         assert entry["body"]["max_completion_tokens"] == 4096 * 3
 
 
@@ -258,16 +175,17 @@ class TestRetrieveBatch:
         }
         return p
 
-    def _make_batch(self, status, output_file_id=None, total=1, completed=0, failed=0):
-        batch = MagicMock()
-        batch.status = status
-        batch.output_file_id = output_file_id
-        counts = MagicMock()
-        counts.total = total
-        counts.completed = completed
-        counts.failed = failed
-        batch.request_counts = counts
-        return batch
+    def _make_batch(
+        self, status, output_file_id=None, error_file_id=None, total=1, completed=0, failed=0
+    ):
+        # Plain namespaces: retrieve_batch only reads these attributes, and unlike
+        # MagicMock an unset one (such as error_file_id) is falsy rather than a child mock
+        return SimpleNamespace(
+            status=status,
+            output_file_id=output_file_id,
+            error_file_id=error_file_id,
+            request_counts=SimpleNamespace(total=total, completed=completed, failed=failed),
+        )
 
     def _make_output_line(self, findings_data):
         body = {
@@ -302,7 +220,7 @@ class TestRetrieveBatch:
             [{"severity": "high", "file": "a.py", "title": "Bug", "description": "Desc"}]
         )
         mock_content = MagicMock()
-        mock_content.read.return_value = output_line.encode("utf-8")
+        mock_content.iter_lines.return_value = [output_line]
         provider.client.files.content.return_value = mock_content
 
         result = provider.retrieve_batch("batch_123")
@@ -324,7 +242,7 @@ class TestRetrieveBatch:
 
         output_line = self._make_output_line([])
         mock_content = MagicMock()
-        mock_content.read.return_value = output_line.encode("utf-8")
+        mock_content.iter_lines.return_value = [output_line]
         provider.client.files.content.return_value = mock_content
 
         provider.retrieve_batch("batch_123")
@@ -341,12 +259,24 @@ class TestRetrieveBatch:
             [{"severity": "low", "file": "a.py", "title": "T", "description": "D"}]
         )
         mock_content = MagicMock()
-        mock_content.read.return_value = output_line.encode("utf-8")
+        mock_content.iter_lines.return_value = [output_line]
         provider.client.files.content.return_value = mock_content
 
         result = provider.retrieve_batch("batch_123", default_focus="security")
         assert result["findings"][0].focus == "security"
 
+    def test_error_file_raises(self, provider):
+        batch = self._make_batch("failed", error_file_id="file-err", total=1, failed=1)
+        provider.client.batches.retrieve.return_value = batch
+
+        error_line = json.dumps({"response": {"body": {"error": {"message": "bad request"}}}})
+        mock_content = MagicMock()
+        mock_content.iter_lines.return_value = ["", error_line]
+        provider.client.files.content.return_value = mock_content
+
+        with pytest.raises(RuntimeError, match="bad request"):
+            provider.retrieve_batch("batch_123")
+
 
 class TestRunAudit:
     def test_polls_until_complete(self):
@@ -391,12 +321,14 @@ class TestRunAudit:
 
         with (
             mock.patch.object(p, "retrieve_batch", side_effect=retrieve_side_effect),
-            mock.patch("time.sleep"),
+            mock.patch("time.sleep") as sleep,
         ):
             findings = p.run_audit([FileContent(path="a.py", content="x = 1")], "prompt", "ctx")
 
         assert findings == []
         assert call_count == 3
+        # Backs off between polls instead of waiting a fixed minute
+        assert [c.args[0] for c in sleep.call_args_list] == [2, 4]
 
 
 class TestImportError:
@@ -3,12 +3,21 @@
 from __future__ import annotations
 
 import json
-from unittest.mock import MagicMock
+from hashlib import sha256
+from unittest.mock import MagicMock, patch
 
 import pytest
 
 from noxaudit.models import Severity
 from noxaudit.providers.anthropic import AnthropicProvider, FINDING_SCHEMA
+from noxaudit.providers.gemini import GeminiProvider
+from noxaudit.providers.openai import OpenAIProvider
+
+
+@pytest.fixture(scope="module")
+def provider():
+    """Client-less provider shared by the stateless ID and parsing tests."""
+    return AnthropicProvider.__new__(AnthropicProvider)
 
 
 class TestFindingSchema:
@@ -22,45 +31,76 @@ class TestFindingSchema:
         assert "focus" not in required
 
 
+@pytest.fixture(
+    scope="module",
+    params=[AnthropicProvider, OpenAIProvider, GeminiProvider],
+    ids=["anthropic", "openai", "gemini"],
+)
+def any_provider(request):
+    """Client-less instance of each provider class."""
+    return request.param.__new__(request.param)
+
+
 class TestMakeFindingId:
-    @pytest.fixture
-    def provider(self, monkeypatch):
-        monkeypatch.setenv("ANTHROPIC_API_KEY", "test-key")
-        p = AnthropicProvider.__new__(AnthropicProvider)
-        return p
+    """Finding IDs come from BaseProvider, so every provider must produce the same ones."""
 
-    def test_stable_hash(self, provider):
+    def test_stable_hash(self, any_provider):
         raw = {"file": "src/app.py", "title": "SQL injection", "line": 42}
-        id1 = provider._make_finding_id(raw)
-        id2 = provider._make_finding_id(raw)
+        id1 = any_provider._make_finding_id(raw)
+        id2 = any_provider._make_finding_id(raw)
         assert id1 == id2
         assert len(id1) == 12
 
-    def test_different_inputs_different_ids(self, provider):
+    def test_different_inputs_different_ids(self, any_provider):
         a = {"file": "a.py", "title": "Bug A", "line": 1}
         b = {"file": "b.py", "title": "Bug B", "line": 2}
-        assert provider._make_finding_id(a) != provider._make_finding_id(b)
+        assert any_provider._make_finding_id(a) != any_provider._make_finding_id(b)
 
-    def test_focus_changes_id(self, provider):
+    def test_focus_changes_id(self, any_provider):
         base = {"file": "a.py", "title": "Bug", "line": 1}
         with_focus = {"file": "a.py", "title": "Bug", "line": 1, "focus": "security"}
-        id_without = provider._make_finding_id(base)
-        id_with = provider._make_finding_id(with_focus)
+        id_without = any_provider._make_finding_id(base)
+        id_with = any_provider._make_finding_id(with_focus)
         assert id_without != id_with
 
-    def test_no_line_still_works(self, provider):
+    def test_no_line_still_works(self, any_provider):
         raw = {"file": "a.py", "title": "Bug"}
-        fid = provider._make_finding_id(raw)
+        fid = any_provider._make_finding_id(raw)
         assert len(fid) == 12
 
+    def test_matches_sha256_key(self, any_provider):
+        raw = {"file": "src/main.py", "title": "SQL injection", "line": 10}
+        expected_id = sha256(b"src/main.py:SQL injection:10").hexdigest()[:12]
+        assert any_provider._make_finding_id(raw) == expected_id
 
-class TestParseResponse:
-    @pytest.fixture
-    def provider(self, monkeypatch):
-        monkeypatch.setenv("ANTHROPIC_API_KEY", "test-key")
-        p = AnthropicProvider.__new__(AnthropicProvider)
-        return p
 
+class TestPollBatch:
+    """Only OpenAI backs off; Anthropic and Gemini keep polling once a minute."""
+
+    @pytest.mark.parametrize(
+        ("cls", "expected_sleeps"),
+        [
+            (AnthropicProvider, [60, 60, 60]),
+            (OpenAIProvider, [2, 4, 8]),
+            (GeminiProvider, [60, 60, 60]),
+        ],
+        ids=["anthropic", "openai", "gemini"],
+    )
+    def test_poll_intervals(self, cls, expected_sleeps):
+        provider = cls.__new__(cls)
+        pending = {"status": "in_progress", "request_counts": {"processing": 1}}
+        done = {"status": "ended", "findings": ["f"]}
+
+        with (
+            patch.object(provider, "retrieve_batch", side_effect=[pending] * 3 + [done]),
+            patch("time.sleep") as sleep,
+        ):
+            assert provider._poll_batch("batch_1") == ["f"]
+
+        assert [c.args[0] for c in sleep.call_args_list] == expected_sleeps
+
+
+class TestParseResponse:
     def _make_message(self, findings_data):
         """Create a mock Anthropic message with JSON response."""
         msg = MagicMock()
@@ -142,6 +182,13 @@ class TestParseResponse:
         findings = provider._parse_response(msg)
         assert len(findings) == 1
 
+    def test_code_block_after_prose(self, provider):
+        msg = MagicMock()
+        content = MagicMock()
+        content.text = 'Here you go:\n```\n{"findings": []}\n```\nLet me know.'
+        msg.content = [content]
+        assert provider._parse_response(msg) == []
+
     def test_multiple_findings(self, provider):
         msg = self._make_message(
             [
@@ -91,7 +91,7 @@ class TestSaveReport:
         path = save_report(report, tmp_path / "reports", "my-app", "security")
         assert path.exists()
         assert "security" in path.name
-        assert path.read_text() == report
+        assert path.read_bytes() == report.encode("utf-8")
 
     def test_combined_focus_in_filename(self, tmp_path, combined_result):
         report = generate_report(combined_result)
@@ -14,6 +14,12 @@ from noxaudit.runner import (
 )
 
 
+@pytest.fixture(scope="module")
+def default_config():
+    """Default config; frozen, so safe to share across the module."""
+    return NoxauditConfig()
+
+
 class TestFocusLabel:
     def test_single(self):
         assert _focus_label(["security"]) == "security"
@@ -28,40 +34,33 @@ class TestFocusLabel:
 
 
 class TestResolveFocusNames:
-    def test_override_single(self):
-        config = NoxauditConfig()
-        names = _resolve_focus_names("security", config)
+    def test_override_single(self, default_config):
+        names = _resolve_focus_names("security", default_config)
         assert names == ["security"]
 
-    def test_override_comma_separated(self):
-        config = NoxauditConfig()
-        names = _resolve_focus_names("security,docs", config)
+    def test_override_comma_separated(self, default_config):
+        names = _resolve_focus_names("security,docs", default_config)
         assert names == ["security", "docs"]
 
-    def test_override_all(self):
-        config = NoxauditConfig()
-        names = _resolve_focus_names("all", config)
+    def test_override_all(self, default_config):
+        names = _resolve_focus_names("all", default_config)
         assert len(names) == 7
 
-    def test_no_override_defaults_to_all(self):
-        config = NoxauditConfig()
-        names = _resolve_focus_names(None, config)
+    def test_no_override_defaults_to_all(self, default_config):
+        names = _resolve_focus_names(None, default_config)
         assert len(names) == 7
 
-    def test_off_returns_empty(self):
-        config = NoxauditConfig()
-        names = _resolve_focus_names("off", config)
+    def test_off_returns_empty(self, default_config):
+        names = _resolve_focus_names("off", default_config)
         assert names == []
 
-    def test_unknown_focus_raises(self):
-        config = NoxauditConfig()
+    def test_unknown_focus_raises(self, default_config):
         with pytest.raises(ValueError, match="Unknown focus area"):
-            _resolve_focus_names("nonexistent", config)
+            _resolve_focus_names("nonexistent", default_config)
 
-    def test_unknown_in_list_raises(self):
-        config = NoxauditConfig()
+    def test_unknown_in_list_raises(self, default_config):
         with pytest.raises(ValueError, match="Unknown focus area"):
-            _resolve_focus_names("security,bogus", config)
+            _resolve_focus_names("security,bogus", default_config)
 
 
 class TestEstimateTokens:
@@ -81,84 +80,89 @@ class TestEstimateTokens:
         assert estimate_tokens(files) == 2000
 
 
+def _sized_file(chars: int) -> FileContent:
+    """A file whose size drives the token estimate without allocating its content."""
+    return FileContent(path="test.py", content="", size=chars)
+
+
 class TestMaybePrepass:
-    def test_explicit_enabled_with_high_tokens(self):
-        """Explicit prepass.enabled=True with tokens > threshold should enable pre-pass."""
-        config = NoxauditConfig(
-            model="claude-opus-4-6",
-            prepass=PrepassConfig(enabled=True, threshold_tokens=600_000),
-        )
-        files = [FileContent(path="test.py", content="a" * 2_401_000)]  # >600K tokens
+    @pytest.mark.parametrize(
+        ("model", "prepass", "chars", "provider", "expected_run", "msg_parts"),
+        [
+            # Explicit enable with tokens over the threshold runs the pre-pass
+            (
+                "claude-opus-4-6",
+                PrepassConfig(enabled=True, threshold_tokens=600_000),
+                2_401_000,  # >600K tokens
+                "anthropic",
+                True,
+                [],
+            ),
+            # Explicit enable below the threshold does not
+            (
+                "claude-opus-4-6",
+                PrepassConfig(enabled=True, threshold_tokens=600_000),
+                100_000,  # 25K tokens
+                "anthropic",
+                False,
+                [],
+            ),
+            # Anthropic above its 200K pricing tier auto-enables
+            (
+                "claude-opus-4-6",
+                PrepassConfig(auto_disable=False),
+                1_000_000,  # 250K tokens
+                "anthropic",
+                True,
+                ["Auto-enabling pre-pass", "250K tokens", "tiered pricing"],
+            ),
+            # Gemini has flat pricing (no tier_threshold), so never auto-enables
+            (
+                "gemini-2.5-flash",
+                PrepassConfig(auto_disable=False),
+                1_000_000,
+                "gemini",
+                False,
+                [],
+            ),
+            # prepass.auto_disable suppresses auto-enable
+            (
+                "claude-opus-4-6",
+                PrepassConfig(auto_disable=True),
+                1_000_000,
+                "anthropic",
+                False,
+                [],
+            ),
+            # Anthropic below its pricing tier does not auto-enable
+            (
+                "claude-opus-4-6",
+                PrepassConfig(auto_disable=False),
+                600_000,  # 150K tokens
+                "anthropic",
+                False,
+                [],
+            ),
+        ],
+        ids=[
+            "explicit-enabled-high-tokens",
+            "explicit-enabled-low-tokens",
+            "anthropic-auto-enable-above-tier",
+            "gemini-no-auto-enable",
+            "anthropic-auto-disable-config",
+            "anthropic-below-tier",
+        ],
+    )
+    def test_maybe_prepass(self, model, prepass, chars, provider, expected_run, msg_parts):
+        config = NoxauditConfig(model=model, prepass=prepass)
+        files = [_sized_file(chars)]
         should_run, returned_files, msg = _maybe_prepass(
-            files, ["security"], config, "test-repo", "anthropic"
+            files, ["security"], config, "test-repo", provider
         )
-        assert should_run is True
+        assert should_run is expected_run
         assert returned_files == files
-        assert msg == ""
-
-    def test_explicit_enabled_with_low_tokens(self):
-        """Explicit prepass.enabled=True but tokens < threshold should NOT enable."""
-        config = NoxauditConfig(
-            model="claude-opus-4-6",
-            prepass=PrepassConfig(enabled=True, threshold_tokens=600_000),
-        )
-        files = [FileContent(path="test.py", content="a" * 100_000)]  # 25K tokens
-        should_run, returned_files, msg = _maybe_prepass(
-            files, ["security"], config, "test-repo", "anthropic"
-        )
-        assert should_run is False
-        assert msg == ""
-
-    def test_anthropic_auto_enable_above_tier_threshold(self):
-        """Anthropic with >200K tokens should auto-enable when auto_disable=False."""
-        config = NoxauditConfig(
-            model="claude-opus-4-6",
-            prepass=PrepassConfig(auto_disable=False),
-        )
-        files = [FileContent(path="test.py", content="a" * 1_000_000)]  # 250K tokens
-        should_run, returned_files, msg = _maybe_prepass(
-            files, ["security"], config, "test-repo", "anthropic"
-        )
-        assert should_run is True
-        assert "Auto-enabling pre-pass" in msg
-        assert "250K tokens" in msg
-        assert "tiered pricing" in msg
-
-    def test_gemini_no_auto_enable(self):
-        """Gemini with high tokens should NOT auto-enable (flat pricing, no tier_threshold)."""
-        config = NoxauditConfig(
-            model="gemini-2.5-flash",
-            prepass=PrepassConfig(auto_disable=False),
-        )
-        files = [FileContent(path="test.py", content="a" * 1_000_000)]  # 250K tokens
-        should_run, returned_files, msg = _maybe_prepass(
-            files, ["security"], config, "test-repo", "gemini"
-        )
-        assert should_run is False
-        assert msg == ""
-
-    def test_anthropic_auto_disable_config(self):
-        """prepass.auto_disable=True should suppress auto-enable."""
-        config = NoxauditConfig(
-            model="claude-opus-4-6",
-            prepass=PrepassConfig(auto_disable=True),
-        )
-        files = [FileContent(path="test.py", content="a" * 1_000_000)]  # 250K tokens
-        should_run, returned_files, msg = _maybe_prepass(
-            files, ["security"], config, "test-repo", "anthropic"
-        )
-        assert should_run is False
-        assert msg == ""
-
-    def test_anthropic_below_tier_threshold(self):
-        """Anthropic with <200K tokens should NOT auto-enable."""
-        config = NoxauditConfig(
-            model="claude-opus-4-6",
-            prepass=PrepassConfig(auto_disable=False),
-        )
-        files = [FileContent(path="test.py", content="a" * 600_000)]  # 150K tokens
-        should_run, returned_files, msg = _maybe_prepass(
-            files, ["security"], config, "test-repo", "anthropic"
-        )
-        assert should_run is False
-        assert msg == ""
+        if msg_parts:
+            for part in msg_parts:
+                assert part in msg
+        else:
+            assert msg == ""
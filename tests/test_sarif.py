@@ -5,8 +5,23 @@ from __future__ import annotations
 import json
 from pathlib import Path
 
+import pytest
+
 from noxaudit.models import Finding, Severity
 from noxaudit.sarif import findings_to_sarif, save_sarif
+from tests.helpers import build_sample_findings
+
+
+@pytest.fixture(scope="module")
+def sample_sarif():
+    """SARIF for the sample findings, built once for the tests that only read it."""
+    return findings_to_sarif(build_sample_findings(), "security", "my-app")
+
+
+@pytest.fixture(scope="module")
+def reports_dir(tmp_path_factory):
+    """Reports directory shared by save tests that don't depend on it being empty."""
+    return tmp_path_factory.mktemp("reports")
 
 
 class TestFindingsToSarif:
@@ -53,20 +68,14 @@ class TestFindingsToSarif:
         # Check fingerprint
         assert result["fingerprints"]["noxauditFindingId"] == "aaa111"
 
-    def test_severity_mapping(self, sample_findings):
+    def test_severity_mapping(self, sample_sarif):
         """HIGH/MEDIUM/LOW → error/warning/note."""
-        sarif = findings_to_sarif(sample_findings, "security", "my-app")
-        results = sarif["runs"][0]["results"]
+        results = sample_sarif["runs"][0]["results"]
+        by_id = {r["fingerprints"]["noxauditFindingId"]: r for r in results}
 
-        high_result = next(r for r in results if r["fingerprints"]["noxauditFindingId"] == "aaa111")
-        medium_result = next(
-            r for r in results if r["fingerprints"]["noxauditFindingId"] == "bbb222"
-        )
-        low_result = next(r for r in results if r["fingerprints"]["noxauditFindingId"] == "ccc333")
-
-        assert high_result["level"] == "error"
-        assert medium_result["level"] == "warning"
-        assert low_result["level"] == "note"
+        assert by_id["aaa111"]["level"] == "error"
+        assert by_id["bbb222"]["level"] == "warning"
+        assert by_id["ccc333"]["level"] == "note"
 
     def test_finding_without_line_number(self):
         """Finding without line number → location without region."""
@@ -140,9 +149,9 @@ class TestFindingsToSarif:
         assert "noxaudit/security" in rule_ids
         assert "noxaudit/performance" in rule_ids
 
-    def test_valid_json_structure(self, sample_findings):
+    def test_valid_json_structure(self, sample_sarif):
         """Output is valid JSON matching SARIF 2.1.0 schema structure."""
-        sarif = findings_to_sarif(sample_findings, "security", "my-app")
+        sarif = sample_sarif
 
         # Should be serializable to JSON
         json_str = json.dumps(sarif)
@@ -178,10 +187,9 @@ class TestFindingsToSarif:
         assert props.get("repo") == "my-app"
         assert props.get("focus") == "security+docs"
 
-    def test_uribaseId_srcroot(self, sample_findings):
+    def test_uribaseId_srcroot(self, sample_sarif):
         """All file URIs use %SRCROOT% as base."""
-        sarif = findings_to_sarif(sample_findings, "security", "my-app")
-        results = sarif["runs"][0]["results"]
+        results = sample_sarif["runs"][0]["results"]
 
         for result in results:
             for location in result["locations"]:
@@ -190,31 +198,31 @@ class TestFindingsToSarif:
 
 
 class TestSaveSarif:
-    def test_creates_file(self, tmp_path, sample_findings):
+    def test_creates_file(self, reports_dir, sample_findings):
         """Save creates a file with correct naming."""
         sarif = findings_to_sarif(sample_findings, "security", "my-app")
-        path = save_sarif(sarif, tmp_path / "reports", "my-app", "security")
+        path = save_sarif(sarif, reports_dir, "my-app", "security")
 
         assert Path(path).exists()
         assert "my-app" in path
         assert "security" in path
         assert path.endswith(".sarif")
 
-    def test_file_contains_valid_json(self, tmp_path, sample_findings):
+    def test_file_contains_valid_json(self, reports_dir, sample_findings):
         """Saved file contains valid JSON."""
         sarif = findings_to_sarif(sample_findings, "security", "my-app")
-        path = save_sarif(sarif, tmp_path / "reports", "my-app", "security")
+        path = save_sarif(sarif, reports_dir, "my-app", "security")
 
-        content = Path(path).read_text()
-        parsed = json.loads(content)
+        with open(path) as f:
+            parsed = json.load(f)
 
         assert parsed["version"] == "2.1.0"
         assert len(parsed["runs"][0]["results"]) == len(sample_findings)
 
-    def test_combined_focus_in_filename(self, tmp_path, sample_findings):
+    def test_combined_focus_in_filename(self, reports_dir, sample_findings):
         """Combined focus areas in filename."""
         sarif = findings_to_sarif(sample_findings, "security+docs", "my-app")
-        path = save_sarif(sarif, tmp_path / "reports", "my-app", "security+docs")
+        path = save_sarif(sarif, reports_dir, "my-app", "security+docs")
 
         assert "security+docs" in path
 